@@ -2,45 +2,86 @@
 Disease Portal Application Factory.
 """
 import os
-from dotenv import load_dotenv
 
-# Load environment variables from .env file (for local development)
-load_dotenv()
+BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+DOTENV_PATH = os.path.join(BASE_DIR, '.env')
 
-from flask import Flask
-from models import db
-from routes import main_bp
-from config import Config
 
+# Applications already built in this process, keyed by config class
+_apps = {}
 
-def create_app(config_class=Config):
-    """
-    Application factory function.
+
+def _build_app(config_class):
+    """Build the Flask application: extensions, blueprints and URL map."""
+    from flask import Flask
+    from models import db
+    from extensions import cache, engine
+    from routes import main_bp, init_database
+    from json_utils import OrjsonProvider
     
-    Args:
-        config_class: Configuration class to use
-        
-    Returns:
-        Configured Flask application instance
-    """
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
     app.config.from_object(config_class)
     
     # Initialize extensions
     db.init_app(app)
+    cache.init_app(app)
     
     # Register blueprints
     app.register_blueprint(main_bp)
     
+    # Schema checks run once here rather than on every import of routes
+    init_database()
+    
+    # Compile the URL map now so gunicorn --preload workers inherit it via fork
+    app.url_map.update()
+    
+    # Don't hand connections opened during startup to forked workers
+    engine.dispose()
+    
     return app
 
 
-# Create the application instance
-app = create_app()
+def create_app(config_class=None):
+    """
+    Application factory function.
+    
+    Flask, the models and the blueprints are imported lazily so that importing
+    this module stays cheap, and the application is built only once per process
+    for each config class.
+    
+    Args:
+        config_class: Configuration class to use (defaults to config.Config)
+        
+    Returns:
+        Configured Flask application instance
+    """
+    # Load environment variables from .env file (for local development).
+    # Must run before config is imported, since Config reads os.environ.
+    # Production sets everything in the environment, so skip the file entirely.
+    if os.environ.get('FLASK_ENV') != 'production' and os.path.exists(DOTENV_PATH):
+        from dotenv import load_dotenv
+        load_dotenv(DOTENV_PATH)
+    
+    from config import Config
+    config_class = config_class or Config
+    
+    if config_class not in _apps:
+        _apps[config_class] = _build_app(config_class)
+    return _apps[config_class]
+
+
+def __getattr__(name):
+    """Create the application instance on first access (e.g. `gunicorn app:app`)."""
+    if name == 'app':
+        application = create_app()
+        globals()['app'] = application
+        return application
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 if __name__ == '__main__':
-    import os
+    app = create_app()
     port = int(os.environ.get('PORT', 5000))
     debug = os.environ.get('FLASK_ENV', 'development') == 'development'
     app.run(host='0.0.0.0', port=port, debug=debug)
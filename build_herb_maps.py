@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Generate the frozen herb lookup tables from herb_names.tsv.
+Run this script after editing herb_names.tsv; it rewrites _generated_herb_maps.py
+so herb_mappings.py can import the tables without rebuilding them on every import.
+"""
+import os
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+SOURCE_PATH = os.path.join(BASE_DIR, "herb_names.tsv")
+OUTPUT_PATH = os.path.join(BASE_DIR, "_generated_herb_maps.py")
+
+HEADER = '''"""
+Frozen Korean-English herb lookup tables.
+AUTO-GENERATED by build_herb_maps.py from herb_names.tsv - do not edit by hand.
+"""
+from types import MappingProxyType
+'''
+
+
+def load_herb_names(path: str) -> dict:
+    """Read the English (Pinyin) -> Korean (한글) mapping from a TSV file."""
+    mappings = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line.strip() or line.startswith("#"):
+                continue
+            english, korean = line.split("\t")
+            mappings[english.strip()] = korean.strip()
+    return mappings
+
+
+def build_korean_to_english(mappings: dict) -> dict:
+    """Build the reverse mapping (Korean -> English)."""
+    korean_to_english = {}
+    for english, korean in mappings.items():
+        # Handle Korean names with parentheses (e.g., "백과 (은행)" -> map both "백과" and "백과 (은행)")
+        korean_to_english[korean] = english
+        # Also map the base Korean name without parentheses
+        if "(" in korean:
+            base_korean = korean.split("(")[0].strip()
+            if base_korean not in korean_to_english:
+                korean_to_english[base_korean] = english
+    return korean_to_english
+
+
+def render_mapping(name: str, comment: str, mapping: dict) -> str:
+    """Render a dict as a MappingProxyType-wrapped literal."""
+    lines = [f"# {comment}", f"{name} = MappingProxyType({{"]
+    for key, value in mapping.items():
+        lines.append(f"    {key!r}: {value!r},")
+    lines.append("})")
+    return "\n".join(lines)
+
+
+def generate(source: str = SOURCE_PATH, destination: str = OUTPUT_PATH):
+    """Regenerate the lookup table module."""
+    mappings = load_herb_names(source)
+    korean_to_english = build_korean_to_english(mappings)
+    english_to_korean_lower = {k.lower(): v for k, v in mappings.items()}
+
+    sections = [
+        HEADER,
+        render_mapping("HERB_NAME_MAPPINGS", "English (Pinyin) -> Korean (한글)", mappings),
+        render_mapping("KOREAN_TO_ENGLISH", "Korean -> English, including base names without parentheses", korean_to_english),
+        render_mapping("ENGLISH_TO_KOREAN_LOWER", "Lowercase English -> Korean for case-insensitive matching", english_to_korean_lower),
+    ]
+    with open(destination, "w", encoding="utf-8") as f:
+        f.write("\n\n".join(sections) + "\n")
+
+    print(f"Wrote {len(mappings)} herbs ({len(korean_to_english)} Korean keys) to {destination}")
+
+
+if __name__ == "__main__":
+    generate()
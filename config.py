@@ -4,26 +4,54 @@ Application configuration settings for Flask Disease Portal.
 import secrets
 import os
 
+# Bound once; the class body below reads several variables at import time
+_env = os.environ.get
+
 class Config:
     """Flask configuration class."""
     
     # Flask settings
-    SECRET_KEY = os.environ.get('SECRET_KEY', secrets.token_hex(32))
+    # Only generate a random key when none is configured (the default argument
+    # form would call token_hex on every start). Note a random key invalidates
+    # sessions on restart, so set SECRET_KEY in production.
+    SECRET_KEY = _env('SECRET_KEY') or secrets.token_hex(32)
     
     # Database configuration
     BASE_DIR = os.path.abspath(os.path.dirname(__file__))
     
     # Handle DATABASE_URL from Render (PostgreSQL)
     # Render uses 'postgres://' but SQLAlchemy needs 'postgresql://'
-    database_url = os.environ.get('DATABASE_URL')
+    database_url = _env('DATABASE_URL')
     if database_url and database_url.startswith('postgres://'):
         database_url = database_url.replace('postgres://', 'postgresql://', 1)
     
     SQLALCHEMY_DATABASE_URI = database_url or f'sqlite:///{os.path.join(BASE_DIR, "diseaseportal.db")}'
     SQLALCHEMY_TRACK_MODIFICATIONS = False
+
+    # Connection pool settings
+    if SQLALCHEMY_DATABASE_URI.startswith('sqlite'):
+        # SQLite: keep SQLAlchemy's per-file connection pool, but allow connections
+        # to be handed between the threads of the dev server / worker pool
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            'connect_args': {'check_same_thread': False}
+        }
+    else:
+        # PostgreSQL: reuse connections and drop ones Render closed while idle
+        SQLALCHEMY_ENGINE_OPTIONS = {
+            'pool_size': int(_env('DB_POOL_SIZE', 10)),
+            'max_overflow': int(_env('DB_MAX_OVERFLOW', 20)),
+            'pool_timeout': 30,
+            'pool_recycle': 1800,
+            'pool_pre_ping': True
+        }
+    
+    # Response cache for the read-only database endpoints (per process)
+    CACHE_TYPE = _env('CACHE_TYPE', 'SimpleCache')
+    CACHE_DEFAULT_TIMEOUT = int(_env('CACHE_DEFAULT_TIMEOUT', 300))
     
     # Enrichr API settings
     ENRICHR_BASE_URL = 'https://maayanlab.cloud/Enrichr'
+    ENRICHR_CACHE_TTL = int(_env('ENRICHR_CACHE_TTL', 24 * 3600))  # per gene set, in the response cache
     DEFAULT_GENE_LIBRARY = 'DisGeNET'
     
     # Search and analysis settings
@@ -31,13 +59,33 @@ class Config:
     MAX_ENRICHMENT_RESULTS = 15
     ADJUSTED_PVALUE_THRESHOLD = 0.05
     
+    # Upper bounds on /analyze input (the UI allows 3 prescriptions)
+    MAX_DISEASE_NAME_CHARS = 255  # same as the String(255) disease_summary name column
+    MAX_ANALYZE_INPUT_CHARS = 10000
+    MAX_PRESCRIPTIONS = 10
+    MAX_HERBS_PER_PRESCRIPTION = 50
+    
     # LLM Settings (Gemini API)
     # IMPORTANT: Set GEMINI_API_KEY as environment variable
     # - Local: Use .env file
     # - Production: Set in server environment variables
-    GEMINI_API_KEY = os.environ.get('GEMINI_API_KEY')
+    GEMINI_API_KEY = _env('GEMINI_API_KEY')
+    GEMINI_MODEL = 'gemini-2.0-flash'
+    
+    # LLM response cache (SQLite file keyed by prompt hash)
+    # Set LLM_CACHE_DISABLE=1 to always call the API (e.g. for evaluation runs)
+    LLM_CACHE_PATH = _env('LLM_CACHE_PATH', os.path.join(BASE_DIR, '.llm_cache', 'responses.sqlite3'))
+    LLM_CACHE_TTL = int(_env('LLM_CACHE_TTL', 30 * 24 * 3600))  # 30 days
+    LLM_CACHE_DISABLE = _env('LLM_CACHE_DISABLE', '').lower() in ('1', 'true', 'yes')
+    
+    # Optional semantic cache tier: reuse a response when a new prompt's embedding is
+    # close enough to a cached one. Requires `pip install sentence-transformers`.
+    # Off by default - prompts that differ only in the disease name embed very closely.
+    LLM_SEMANTIC_CACHE = _env('LLM_SEMANTIC_CACHE', '').lower() in ('1', 'true', 'yes')
+    LLM_SEMANTIC_THRESHOLD = float(_env('LLM_SEMANTIC_THRESHOLD', 0.92))
+    LLM_SEMANTIC_MODEL = _env('LLM_SEMANTIC_MODEL', 'sentence-transformers/all-MiniLM-L6-v2')
     
     # Demo Login Credentials (for professor access)
     # You can change these or set via environment variables
-    DEMO_USERNAME = os.environ.get('DEMO_USERNAME', 'professor')
-    DEMO_PASSWORD = os.environ.get('DEMO_PASSWORD', 'kiom2026')
\ No newline at end of file
+    DEMO_USERNAME = _env('DEMO_USERNAME', 'professor')
+    DEMO_PASSWORD = _env('DEMO_PASSWORD', 'kiom2026')
\ No newline at end of file
@@ -5,6 +5,8 @@ Run this script once after deployment to set up the database.
 """
 import os
 import requests
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
 
 # Google Drive file ID - UPDATE THIS with your actual file ID
 # Get from the sharing link: https://drive.google.com/file/d/FILE_ID_HERE/view
@@ -12,6 +14,107 @@ GDRIVE_FILE_ID = "1VuGmIvan8cXLai2LvzF1WUwI5FqTKtrB"
 
 DB_PATH = os.path.join(os.path.dirname(__file__), "diseaseportal.db")
 
+# Read the response in large blocks; progress is printed at most once per MiB
+CHUNK_SIZE = 8 * 1024 * 1024
+PROGRESS_STEP = 1024 * 1024
+
+# Parallel download: 16 MiB byte ranges fetched by up to 8 workers
+PART_SIZE = 16 * 1024 * 1024
+MAX_WORKERS = 8
+
+
+def _ranged_download_size(session, url) -> int:
+    """Return the file size if the server supports byte-range requests, else 0."""
+    if not hasattr(os, 'pwrite'):
+        return 0
+    try:
+        response = session.head(url, allow_redirects=True, timeout=30)
+    except requests.exceptions.RequestException:
+        return 0
+    
+    if not response.ok or response.headers.get('accept-ranges', '').lower() != 'bytes':
+        return 0
+    # Ranges index the encoded body, so skip the fast path for compressed transfers
+    if response.headers.get('content-encoding'):
+        return 0
+    return int(response.headers.get('content-length', 0))
+
+
+def _download_range(session, url, start, end, fd) -> int:
+    """Download bytes start..end (inclusive) of url and write them at the same offset."""
+    response = session.get(url, headers={'Range': f'bytes={start}-{end}'}, stream=True, timeout=60)
+    if response.status_code != 206:
+        raise IOError(f"Range request {start}-{end} failed with status {response.status_code}")
+    
+    offset = start
+    for chunk in response.iter_content(chunk_size=PROGRESS_STEP):
+        os.pwrite(fd, chunk, offset)
+        offset += len(chunk)
+    
+    if offset != end + 1:
+        raise IOError(f"Range {start}-{end} ended early at byte {offset}")
+    return offset - start
+
+
+def _download_parallel(session, url, destination, total_size):
+    """Download url into destination with parallel byte-range requests."""
+    ranges = [(start, min(start + PART_SIZE, total_size) - 1) for start in range(0, total_size, PART_SIZE)]
+    downloaded = 0
+    
+    fd = os.open(destination, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        if hasattr(os, 'posix_fallocate'):
+            # Reserve the whole file up front to avoid fragmentation
+            os.posix_fallocate(fd, 0, total_size)
+        
+        with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(ranges))) as executor:
+            futures = [
+                executor.submit(_download_range, session, url, start, end, fd)
+                for start, end in ranges
+            ]
+            for future in as_completed(futures):
+                downloaded += future.result()
+                percent = (downloaded / total_size) * 100
+                print(f"\rProgress: {percent:.1f}%", end="")
+        
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _download_stream(response, destination):
+    """Download a single streamed response into destination."""
+    total_size = int(response.headers.get('content-length', 0))
+    downloaded = 0
+    reported_mb = 0
+    
+    # Let urllib3 undo any gzip/deflate transfer encoding while we read raw blocks
+    response.raw.decode_content = True
+    
+    with open(destination, 'wb') as f:
+        if total_size and hasattr(os, 'posix_fallocate'):
+            # Reserve the whole file up front to avoid fragmentation
+            os.posix_fallocate(f.fileno(), 0, total_size)
+        
+        while True:
+            chunk = response.raw.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            f.write(chunk)
+            downloaded += len(chunk)
+            
+            # Only report progress once per MiB
+            if total_size and downloaded // PROGRESS_STEP > reported_mb:
+                reported_mb = downloaded // PROGRESS_STEP
+                percent = (downloaded / total_size) * 100
+                print(f"\rProgress: {percent:.1f}%", end="")
+        
+        # Trim any preallocated space the server did not send, then flush once
+        f.truncate(downloaded)
+        f.flush()
+        os.fsync(f.fileno())
+
+
 def download_from_gdrive(file_id: str, destination: str):
     """Download a file from Google Drive."""
     print(f"Downloading database to {destination}...")
@@ -19,7 +122,11 @@ def download_from_gdrive(file_id: str, destination: str):
     # Google Drive direct download URL
     url = f"https://drive.google.com/uc?export=download&id={file_id}&confirm=t"
     
+    # One session for every request so TCP/TLS connections are reused across ranges
     session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
     response = session.get(url, stream=True)
     
     # Handle large file confirmation
@@ -29,18 +136,23 @@ def download_from_gdrive(file_id: str, destination: str):
             response = session.get(url, stream=True)
             break
     
-    # Save the file
-    total_size = int(response.headers.get('content-length', 0))
-    downloaded = 0
-    
-    with open(destination, 'wb') as f:
-        for chunk in response.iter_content(chunk_size=32768):
-            if chunk:
-                f.write(chunk)
-                downloaded += len(chunk)
-                if total_size:
-                    percent = (downloaded / total_size) * 100
-                    print(f"\rProgress: {percent:.1f}%", end="")
+    # Save the file: parallel ranges when supported, otherwise a single stream. Both write
+    # a preallocated file, so download into a .part file and only move it into place once
+    # complete - a failed run must not leave a partly zero-filled database behind
+    part_path = destination + '.part'
+    try:
+        total_size = _ranged_download_size(session, url)
+        if total_size:
+            response.close()
+            print(f"Using {min(MAX_WORKERS, -(-total_size // PART_SIZE))} parallel range requests")
+            _download_parallel(session, url, part_path, total_size)
+        else:
+            _download_stream(response, part_path)
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+    os.replace(part_path, destination)
     
     print(f"\nDownload complete! Size: {os.path.getsize(destination) / (1024*1024):.1f} MB")
 
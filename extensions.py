@@ -0,0 +1,17 @@
+"""
+Flask extension instances shared by the app factory and the blueprints.
+"""
+from flask_caching import Cache
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker, scoped_session
+
+from config import Config
+
+# Response cache for read-only endpoints (configured from Config in create_app)
+cache = Cache()
+
+# One engine (and connection pool) for the routes and the analysis services; pool sizes
+# come from Config. Sessions are scoped to the current thread, i.e. to the request being
+# handled, and removed by the blueprint's teardown hook.
+engine = create_engine(Config.SQLALCHEMY_DATABASE_URI, **Config.SQLALCHEMY_ENGINE_OPTIONS)
+db_session = scoped_session(sessionmaker(bind=engine))
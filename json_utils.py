@@ -0,0 +1,53 @@
+"""
+Fast JSON helpers built on orjson.
+Used for stored analysis results and, through OrjsonProvider, for Flask's
+jsonify/tojson/get_json.
+"""
+import json
+
+import orjson
+from flask.json.provider import DefaultJSONProvider
+
+
+# Dict keys aren't always strings (e.g. integer ids), which stdlib json accepts
+_DUMPS_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj):
+    """Fallback for values orjson can't encode natively, matching json.dumps(default=str)."""
+    if isinstance(obj, float):  # float subclasses such as numpy.float64 stay numbers
+        return float(obj)
+    return str(obj)
+
+
+def dumps(obj) -> str:
+    """Serialize obj to a JSON string (non-ASCII characters are kept as is)."""
+    return orjson.dumps(obj, default=_default, option=_DUMPS_OPTIONS).decode()
+
+
+def loads(s):
+    """Parse JSON text (str or bytes), accepting NaN/Infinity literals such as older rows were saved with."""
+    try:
+        return orjson.loads(s)
+    except orjson.JSONDecodeError:
+        return json.loads(s)
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """Flask JSON provider that serializes with orjson, falling back to the default provider."""
+
+    def dumps(self, obj, **kwargs):
+        option = _DUMPS_OPTIONS | orjson.OPT_PASSTHROUGH_DATETIME
+        if kwargs.get('sort_keys', self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        try:
+            # Flask's default() keeps its own encodings (HTTP dates, Decimal, __html__)
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except TypeError:
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s, **kwargs):
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return super().loads(s, **kwargs)
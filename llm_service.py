@@ -3,23 +3,327 @@ LLM Service for AI-powered pathway analysis using Google Gemini API.
 Returns structured JSON with summary_table, detailed_analysis, and clinical_questions.
 """
 import requests
-import json
+import orjson
 import re
+import os
+import time
+import hashlib
+import sqlite3
+import threading
 import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from requests.adapters import HTTPAdapter
+from dotenv import load_dotenv
 from config import Config
 
+DOTENV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
 
-def get_gemini_response(prompt: str, json_mode: bool = True) -> str:
+
+def _local_dotenv_path():
+    """The .env path for local development; None in production (same guard as create_app) or without one."""
+    if os.environ.get('FLASK_ENV') == 'production' or not os.path.exists(DOTENV_PATH):
+        return None
+    return DOTENV_PATH
+
+
+# Load .env once at import (local development); the key is then re-read at most once a minute
+if _local_dotenv_path():
+    load_dotenv(DOTENV_PATH)
+
+
+# How long a looked-up API key is reused before .env is read again
+API_KEY_TTL = 60
+
+
+@lru_cache(maxsize=1)
+def _get_api_key_cached(bucket: int) -> str:
+    """Re-read .env (outside production) and return the API key; cached per time bucket."""
+    dotenv_path = _local_dotenv_path()
+    if dotenv_path:
+        load_dotenv(dotenv_path, override=True)  # Pick up key rotations without restarting
+    return os.environ.get('GEMINI_API_KEY') or Config.GEMINI_API_KEY
+
+
+def get_api_key() -> str:
+    """Return the Gemini API key, reloading .env (outside production) at most once per API_KEY_TTL seconds."""
+    return _get_api_key_cached(int(time.time()) // API_KEY_TTL)
+
+
+# Shared HTTP session so retries and concurrent analyses reuse pooled TLS connections
+_SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(pool_connections=8, pool_maxsize=16, max_retries=0))
+
+
+class LLMError(Exception):
+    """A Gemini API request was rejected with an HTTP error status."""
+    
+    def __init__(self, status: int, retry_after: float = None):
+        super().__init__(f"Gemini API returned status {status}")
+        self.status = status
+        self.retry_after = retry_after
+
+
+class LLMTerminalError(LLMError):
+    """The request can't succeed as sent (bad key, quota, malformed request); don't retry."""
+
+
+class LLMTransientError(LLMError):
+    """Rate limiting or a server-side error; the request may succeed after a pause."""
+
+
+# Statuses worth retrying after a backoff; any other 4xx is terminal
+TRANSIENT_STATUSES = (429, 500, 502, 503, 504)
+MAX_BACKOFF = 8
+
+
+def _retry_after_seconds(value: str) -> float:
+    """Parse a Retry-After header given in seconds (HTTP dates are ignored)."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _wait_before_retry(attempt: int, error: LLMTransientError):
+    """Sleep before the next attempt: Retry-After when given, else exponential backoff."""
+    delay = min(2 ** attempt if error.retry_after is None else error.retry_after, MAX_BACKOFF)
+    print(f"[LLM] {error}; retrying in {delay:.0f}s")
+    time.sleep(delay)
+
+
+# Server-sent events: text arrives as it is generated, and the read timeout
+# applies to gaps between chunks rather than to the whole response
+_URL_TEMPLATE = (
+    "https://generativelanguage.googleapis.com/v1beta/models/"
+    + Config.GEMINI_MODEL + ":streamGenerateContent?alt=sse&key={}"
+)
+_HEADERS = {"Content-Type": "application/json"}
+
+
+@lru_cache(maxsize=4)
+def _url_for(api_key: str) -> str:
+    """Request URL for an API key."""
+    return _URL_TEMPLATE.format(api_key)
+
+
+@lru_cache(maxsize=8)
+def _generation_config(json_mode: bool, max_output_tokens: int) -> dict:
+    """Generation settings, built once per combination (treat the result as read-only)."""
+    generation_config = {
+        "temperature": 0.4,
+        "maxOutputTokens": max_output_tokens
+    }
+    # Use JSON response mode when requested — forces Gemini to output valid JSON
+    if json_mode:
+        generation_config["responseMimeType"] = "application/json"
+    return generation_config
+
+
+# Persistent response cache: SHA-256(model|json_mode|prompt) -> response text
+_cache_conn = None
+_cache_lock = threading.Lock()
+
+
+def _get_cache():
+    """Open the SQLite response cache on first use."""
+    global _cache_conn
+    if _cache_conn is None:
+        os.makedirs(os.path.dirname(Config.LLM_CACHE_PATH), exist_ok=True)
+        conn = sqlite3.connect(Config.LLM_CACHE_PATH, timeout=10, check_same_thread=False)
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS llm_cache ("
+            "key TEXT PRIMARY KEY, response TEXT NOT NULL, expires_at REAL NOT NULL)"
+        )
+        conn.commit()
+        _cache_conn = conn
+    return _cache_conn
+
+
+def _cache_mode(json_mode: bool, system_instruction: str = None, max_output_tokens: int = 4096) -> str:
+    """Describe everything besides the prompt that shapes a response."""
+    system_hash = hashlib.sha256((system_instruction or '').encode('utf-8')).hexdigest()[:16]
+    mode = f"{Config.GEMINI_MODEL}|{json_mode}|{system_hash}"
+    # Only longer output budgets change the key, so existing cache entries stay valid
+    if max_output_tokens != 4096:
+        mode += f"|{max_output_tokens}"
+    return mode
+
+
+def _cache_key(prompt: str, mode: str) -> str:
+    """Build the cache key for a prompt."""
+    return hashlib.sha256(f"{mode}|{prompt}".encode('utf-8')).hexdigest()
+
+
+def cache_get(key: str) -> str:
+    """Return a cached, unexpired response or None."""
+    try:
+        with _cache_lock:
+            row = _get_cache().execute(
+                "SELECT response FROM llm_cache WHERE key = ? AND expires_at > ?",
+                (key, time.time())
+            ).fetchone()
+        return row[0] if row else None
+    except sqlite3.Error as e:
+        print(f"[LLM] Cache read error: {e}")
+        return None
+
+
+def cache_set(key: str, text: str):
+    """Store a response in the cache for Config.LLM_CACHE_TTL seconds."""
+    try:
+        with _cache_lock:
+            conn = _get_cache()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, response, expires_at) VALUES (?, ?, ?)",
+                (key, text, time.time() + Config.LLM_CACHE_TTL)
+            )
+            conn.commit()
+    except sqlite3.Error as e:
+        print(f"[LLM] Cache write error: {e}")
+
+
+# Semantic cache tier (Config.LLM_SEMANTIC_CACHE): prompt embeddings held as one
+# normalized matrix so a lookup is a single matrix-vector product
+_semantic = {'model': None, 'loaded': False, 'rows': {}, 'modes': [], 'responses': [], 'matrix': None}
+
+
+def _get_embedder():
+    """Load the sentence-transformers model on first use (None if unavailable)."""
+    if _semantic['model'] is None:
+        try:
+            from sentence_transformers import SentenceTransformer
+        except ImportError:
+            print("[LLM] sentence-transformers not installed, disabling semantic cache")
+            Config.LLM_SEMANTIC_CACHE = False
+            return None
+        _semantic['model'] = SentenceTransformer(Config.LLM_SEMANTIC_MODEL)
+    return _semantic['model']
+
+
+@lru_cache(maxsize=8)
+def _embed(prompt: str):
+    """Embed a prompt as a unit-length float32 vector (None if unavailable)."""
+    model = _get_embedder()
+    if model is None:
+        return None
+    return model.encode(prompt, normalize_embeddings=True).astype('float32')
+
+
+def _load_semantic_cache():
+    """Read stored embeddings into memory on first use."""
+    import numpy as np
+    
+    conn = _get_cache()
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS llm_semantic_cache ("
+        "key TEXT PRIMARY KEY, mode TEXT NOT NULL, embedding BLOB NOT NULL, "
+        "response TEXT NOT NULL, expires_at REAL NOT NULL)"
+    )
+    conn.commit()
+    rows = conn.execute(
+        "SELECT key, mode, embedding, response FROM llm_semantic_cache WHERE expires_at > ?",
+        (time.time(),)
+    ).fetchall()
+    
+    _semantic['rows'] = {r[0]: i for i, r in enumerate(rows)}
+    _semantic['modes'] = [r[1] for r in rows]
+    _semantic['responses'] = [r[3] for r in rows]
+    _semantic['matrix'] = np.vstack([np.frombuffer(r[2], dtype=np.float32) for r in rows]) if rows else None
+    _semantic['loaded'] = True
+
+
+def semantic_cache_get(prompt: str, mode: str) -> str:
+    """Return the cached response of the most similar prompt, if similar enough."""
+    import numpy as np
+    
+    try:
+        query = _embed(prompt)
+        if query is None:
+            return None
+        
+        with _cache_lock:
+            if not _semantic['loaded']:
+                _load_semantic_cache()
+            if _semantic['matrix'] is None:
+                return None
+            # Rows are unit vectors, so the dot product is the cosine similarity
+            sims = _semantic['matrix'] @ query
+            for i in np.argsort(-sims):
+                if sims[i] < Config.LLM_SEMANTIC_THRESHOLD:
+                    break
+                if _semantic['modes'][i] == mode:
+                    print(f"[LLM] Semantic cache hit (similarity {sims[i]:.3f})")
+                    return _semantic['responses'][i]
+        return None
+    except Exception as e:
+        print(f"[LLM] Semantic cache read error: {e}")
+        return None
+
+
+def semantic_cache_set(key: str, prompt: str, mode: str, text: str):
+    """Store a response and its prompt embedding in the semantic cache (replacing key's entry)."""
+    import numpy as np
+    
+    try:
+        vector = _embed(prompt)
+        if vector is None:
+            return
+        
+        with _cache_lock:
+            if not _semantic['loaded']:
+                _load_semantic_cache()
+            conn = _get_cache()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_semantic_cache (key, mode, embedding, response, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (key, mode, vector.tobytes(), text, time.time() + Config.LLM_CACHE_TTL)
+            )
+            conn.commit()
+            
+            if key in _semantic['rows']:
+                _semantic['responses'][_semantic['rows'][key]] = text
+            else:
+                _semantic['rows'][key] = len(_semantic['responses'])
+                _semantic['modes'].append(mode)
+                _semantic['responses'].append(text)
+                matrix = _semantic['matrix']
+                _semantic['matrix'] = vector[None, :] if matrix is None else np.vstack([matrix, vector])
+    except Exception as e:
+        print(f"[LLM] Semantic cache write error: {e}")
+
+
+def get_gemini_response(prompt: str, json_mode: bool = True, use_cache: bool = True,
+                        system_instruction: str = None, max_output_tokens: int = 4096) -> str:
     """
     Send a prompt to Google Gemini API and get a response.
     Uses JSON response mode by default for reliable structured output.
-    Reads API key from os.environ each time to pick up .env changes.
+    The API key is re-read from .env at most once a minute to pick up changes.
+    
+    The invariant task description goes in system_instruction, so every request
+    of a kind shares the same prefix and only the data varies in the prompt.
+    
+    Successful responses are cached by prompt hash (and, with LLM_SEMANTIC_CACHE,
+    by prompt embedding so near-identical prompts can reuse them). Pass use_cache=False to skip
+    the cache lookup (e.g. when retrying after a cached answer failed to parse);
+    the fresh response then replaces the cached one.
+    
+    Raises LLMTerminalError for error statuses that retrying can't fix and
+    LLMTransientError for rate limits and server errors.
     """
-    import os
-    from dotenv import load_dotenv
-    load_dotenv(override=True)  # Re-read .env each time to pick up key changes
+    cache_enabled = not Config.LLM_CACHE_DISABLE
+    mode = _cache_mode(json_mode, system_instruction, max_output_tokens)
+    key = _cache_key(prompt, mode) if cache_enabled else None
+    
+    if cache_enabled and use_cache:
+        cached = cache_get(key)
+        if cached is None and Config.LLM_SEMANTIC_CACHE:
+            cached = semantic_cache_get(prompt, mode)
+        if cached is not None:
+            print(f"[LLM] Cache hit (length: {len(cached)} chars)")
+            return cached
     
-    api_key = os.environ.get('GEMINI_API_KEY') or Config.GEMINI_API_KEY
+    api_key = get_api_key()
     
     if not api_key:
         print("[LLM] Error: No Gemini API key configured")
@@ -27,61 +331,65 @@ def get_gemini_response(prompt: str, json_mode: bool = True) -> str:
     
     print(f"[LLM] Using API key: {api_key[:8]}...{api_key[-4:]} (len={len(api_key)})")
     
-    url = f"https://generativelanguage.googleapis.com/v1beta/models/gemini-2.0-flash:generateContent?key={api_key}"
-    
-    headers = {
-        "Content-Type": "application/json"
-    }
-    
-    generation_config = {
-        "temperature": 0.4,
-        "maxOutputTokens": 4096
-    }
-    
-    # Use JSON response mode when requested — forces Gemini to output valid JSON
-    if json_mode:
-        generation_config["responseMimeType"] = "application/json"
-    
     data = {
         "contents": [{
             "parts": [{
                 "text": prompt
             }]
         }],
-        "generationConfig": generation_config
+        "generationConfig": _generation_config(json_mode, max_output_tokens)
     }
+    if system_instruction:
+        data["systemInstruction"] = {"parts": [{"text": system_instruction}]}
     
     try:
         print(f"[LLM] Sending request to Gemini API (prompt length: {len(prompt)} chars, json_mode={json_mode})...")
-        response = requests.post(url, headers=headers, json=data, timeout=90)
-        
-        if not response.ok:
-            print(f"[LLM] API Error: Status {response.status_code}")
-            print(f"[LLM] Response: {response.text[:500]}")
-            return None
-        
-        result = response.json()
+        with _SESSION.post(_url_for(api_key), headers=_HEADERS, data=orjson.dumps(data), stream=True, timeout=(10, 90)) as response:
+            if not response.ok:
+                print(f"[LLM] API Error: Status {response.status_code}")
+                print(f"[LLM] Response: {response.text[:500]}")
+                if response.status_code in TRANSIENT_STATUSES or response.status_code >= 500:
+                    raise LLMTransientError(response.status_code,
+                                            _retry_after_seconds(response.headers.get('Retry-After')))
+                raise LLMTerminalError(response.status_code)
+            
+            # Each event carries the next piece of the first candidate's text
+            text_parts = []
+            finish_reason = None
+            last_event = None
+            for line in response.iter_lines():
+                if not line.startswith(b'data:'):
+                    continue
+                last_event = orjson.loads(line[5:])
+                candidates = last_event.get("candidates")
+                if not candidates:
+                    continue
+                candidate = candidates[0]
+                for part in candidate.get("content", {}).get("parts", ()):
+                    if "text" in part:
+                        text_parts.append(part["text"])
+                finish_reason = candidate.get("finishReason", finish_reason)
         
-        if "candidates" in result and len(result["candidates"]) > 0:
-            candidate = result["candidates"][0]
-            if "content" in candidate and "parts" in candidate["content"]:
-                parts = candidate["content"]["parts"]
-                if len(parts) > 0 and "text" in parts[0]:
-                    text = parts[0]["text"]
-                    print(f"[LLM] Received response (length: {len(text)} chars)")
-                    return text
+        if text_parts:
+            text = "".join(text_parts)
+            print(f"[LLM] Received response (length: {len(text)} chars)")
+            if cache_enabled:
+                cache_set(key, text)
+                if Config.LLM_SEMANTIC_CACHE:
+                    semantic_cache_set(key, prompt, mode, text)
+            return text
         
         # Check for blocked content or safety issues
-        if "candidates" in result and len(result["candidates"]) > 0:
-            candidate = result["candidates"][0]
-            if "finishReason" in candidate and candidate["finishReason"] != "STOP":
-                print(f"[LLM] Finish reason: {candidate['finishReason']}")
+        if finish_reason and finish_reason != "STOP":
+            print(f"[LLM] Finish reason: {finish_reason}")
         
-        print(f"[LLM] Unexpected response structure: {str(result)[:500]}")
+        print(f"[LLM] Unexpected response structure: {str(last_event)[:500]}")
         return None
         
+    except LLMError:
+        raise
     except requests.exceptions.Timeout:
-        print("[LLM] API request timed out (90s)")
+        print("[LLM] API request timed out (no data for 90s)")
         return None
     except requests.exceptions.RequestException as e:
         print(f"[LLM] API Request Error: {str(e)}")
@@ -92,6 +400,18 @@ def get_gemini_response(prompt: str, json_mode: bool = True) -> str:
         return None
 
 
+# Patterns used by the JSON extractors, compiled once
+_RE_JSON_BLOCK = re.compile(r'```(?:json)?\s*([\s\S]*?)\s*```')
+_RE_JSON_OBJ = re.compile(r'\{[\s\S]*\}')
+_RE_JSON_ARR = re.compile(r'\[[\s\S]*\]')
+_RE_UNESC_NL = re.compile(r'(?<!\\)\n')
+_RE_UNESC_CR = re.compile(r'(?<!\\)\r')
+_RE_UNESC_TAB = re.compile(r'(?<!\\)\t')
+
+# ASCII control characters that break JSON parsing (all except tab, newline, carriage return)
+_CTRL_DELETE = dict.fromkeys([i for i in range(32) if i not in (9, 10, 13)], None)
+
+
 def extract_json_from_response(text: str) -> dict:
     """
     Extract JSON object from LLM response text.
@@ -101,57 +421,64 @@ def extract_json_from_response(text: str) -> dict:
     if not text:
         return None
     
+    # JSON response mode usually returns a clean object, so try parsing it directly first
+    try:
+        parsed = orjson.loads(text)
+        if isinstance(parsed, dict):
+            return parsed
+    except orjson.JSONDecodeError:
+        pass
+    
     # Try to find JSON in code blocks first
-    json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', text)
+    json_match = _RE_JSON_BLOCK.search(text)
     if json_match:
         json_str = json_match.group(1)
     else:
         # Try to find raw JSON object
-        json_match = re.search(r'\{[\s\S]*\}', text)
+        json_match = _RE_JSON_OBJ.search(text)
         if json_match:
             json_str = json_match.group(0)
         else:
             return None
     
-    # Clean control characters that break JSON parsing
-    # Replace actual newlines/tabs inside strings with escaped versions
-    # First, we need to handle the JSON more carefully
-    def clean_json_string(s):
-        # Remove or replace problematic control characters
-        # Keep \n, \r, \t as they're valid in JSON when escaped
-        cleaned = s
-        # Replace unescaped control characters (ASCII 0-31 except \t \n \r)
-        for i in range(32):
-            if i not in (9, 10, 13):  # tab, newline, carriage return
-                cleaned = cleaned.replace(chr(i), '')
-        return cleaned
-    
-    json_str = clean_json_string(json_str)
+    # Clean control characters that break JSON parsing, in a single pass
+    # (\n, \r, \t are kept; they're handled by the cleanup below if needed)
+    json_str = json_str.translate(_CTRL_DELETE)
     
     try:
-        return json.loads(json_str)
-    except json.JSONDecodeError as e:
+        return orjson.loads(json_str)
+    except orjson.JSONDecodeError as e:
         print(f"JSON parse error: {e}")
         # Try a more aggressive cleanup: replace all control chars in string values
         try:
             # Try to fix common issues: unescaped newlines in strings
             # Replace literal newlines that might be inside JSON strings
-            fixed = re.sub(r'(?<!\\)\n', '\\n', json_str)
-            fixed = re.sub(r'(?<!\\)\r', '\\r', fixed)
-            fixed = re.sub(r'(?<!\\)\t', '\\t', fixed)
-            return json.loads(fixed)
-        except json.JSONDecodeError as e2:
+            fixed = _RE_UNESC_NL.sub('\\n', json_str)
+            fixed = _RE_UNESC_CR.sub('\\r', fixed)
+            fixed = _RE_UNESC_TAB.sub('\\t', fixed)
+            return orjson.loads(fixed)
+        except orjson.JSONDecodeError as e2:
             print(f"JSON parse error after cleanup: {e2}")
             # Last resort: try to extract just the structure
             try:
                 # Remove all newlines and extra whitespace
                 compact = ' '.join(json_str.split())
-                return json.loads(compact)
+                return orjson.loads(compact)
             except:
                 print(f"[LLM] Could not parse JSON even after cleanup")
                 return None
 
 
+def _fmt_p(value) -> str:
+    """Format a p-value for the prompt (numbers in scientific notation)."""
+    return f"{value:.2e}" if isinstance(value, (int, float)) else value
+
+
+def _fmt_s(value) -> str:
+    """Format a combined score for the prompt (numbers to one decimal)."""
+    return f"{value:.1f}" if isinstance(value, (int, float)) else value
+
+
 def format_enrichment_data_for_llm(enrichment_results: list, top_n: int = 10) -> str:
     """
     Format enrichment results into a readable format for LLM analysis.
@@ -159,20 +486,139 @@ def format_enrichment_data_for_llm(enrichment_results: list, top_n: int = 10) ->
     if not enrichment_results:
         return "No enrichment data available."
     
-    lines = []
-    for i, result in enumerate(enrichment_results[:top_n], 1):
-        term = result.get('term', 'Unknown')
-        p_value = result.get('adjusted_p_value', result.get('p_value', 'N/A'))
-        score = result.get('combined_score', 'N/A')
-        
-        if isinstance(p_value, (int, float)):
-            p_value = f"{p_value:.2e}"
-        if isinstance(score, (int, float)):
-            score = f"{score:.1f}"
-            
-        lines.append(f"{i}. {term} (p-value: {p_value}, score: {score})")
-    
-    return "\n".join(lines)
+    # The same rows are formatted for several prompts per analysis, so cache by content
+    rows_key = tuple(
+        (r.get('term', 'Unknown'), r.get('adjusted_p_value', r.get('p_value', 'N/A')), r.get('combined_score', 'N/A'))
+        for r in enrichment_results[:top_n]
+    )
+    try:
+        return _format_cached(rows_key)
+    except TypeError:  # unhashable values; format without caching
+        return _format_cached.__wrapped__(rows_key)
+
+
+@lru_cache(maxsize=64)
+def _format_cached(rows_key: tuple) -> str:
+    """Format (term, p-value, score) rows as a numbered list."""
+    return "\n".join([
+        f"{i}. {term} (p-value: {_fmt_p(p_value)}, score: {_fmt_s(score)})"
+        for i, (term, p_value, score) in enumerate(rows_key, 1)
+    ])
+
+
+# Invariant task descriptions, sent as the Gemini system instruction. Keeping them
+# byte-identical across requests gives every call of a kind the same prompt prefix,
+# so the API can reuse its processing; only the disease and data go in the prompt.
+SYSTEM_PROMPT_COMPARATIVE = """You are an expert Research Scientist in pathology and bioinformatics. Your task is to perform a comparative analysis of multiple disease clusters provided by the user.
+
+You must return your response in a strict JSON format with exactly two keys: "summary_table" and "detailed_analysis".
+
+1. "summary_table":
+   - An array of objects representing the rows of a comparison table.
+   - Each object must have the key "Feature" plus one key per group column listed by the user.
+   - Include rows for: "Primary Driver", "Key Tissue", "Main Consequence", and "Cancer Risk".
+   - Keep the values in this table concise (under 10 words).
+
+2. "detailed_analysis":
+   - A single string containing a comprehensive, Markdown-formatted report.
+   - This report must include:
+     - "1. The High-Level Comparison": A brief summary of the fundamental differences.
+     - "2. Deep Dive into Pathways": A detailed breakdown of the mechanism for each group (Group 1, Group 2, Group 3).
+     - Use bolding and bullet points for readability.
+
+Do not include any text outside the JSON object."""
+
+SYSTEM_PROMPT_CLINICAL = """You are a senior clinical diagnostician. Your task is to analyze the provided disease groups and generate a structured clinical interview guide.
+
+You must return your response in a strict JSON format. 
+The JSON must be a single list (array) of objects, where each object represents one disease group.
+
+Each object in the list must contain exactly these keys:
+1. "group_label": A short, descriptive title for the group (e.g., "Group 1: Vascular & Tobacco").
+2. "suspected_driver": A concise summary of the underlying pathology (e.g., "Systemic Nicotine Toxicity").
+3. "clinical_questions": An array of strings. Each string is a specific high-yield question the doctor should ask the patient.
+4. "rationale_hidden": A Markdown-formatted string explaining *why* these questions are critical and what the doctor should look for. This will be shown only when requested.
+
+Example Structure:
+[
+  {
+    "group_label": "Group 1...",
+    "suspected_driver": "...",
+    "clinical_questions": ["Question 1?", "Question 2?"],
+    "rationale_hidden": "**Why this matters:** This tests for..."
+  }
+]
+
+Generate exactly one group object for each prescription group given by the user.
+
+Do not include any text outside the JSON array."""
+
+SYSTEM_PROMPT_SINGLE_ANALYSIS = """You are an expert Research Scientist in pathology and bioinformatics. Analyze the gene enrichment results for a traditional Chinese medicine prescription targeting the disease named by the user.
+
+You must return your response in a strict JSON format with exactly two keys: "summary_table" and "detailed_analysis".
+
+1. "summary_table":
+   - An array of objects with keys: "Feature", "Finding".
+   - Include rows for: "Primary Driver", "Key Tissue", "Main Consequence", "Cancer Risk".
+   - Keep values concise (under 10 words).
+
+2. "detailed_analysis":
+   - A Markdown-formatted report including:
+     - "1. Key Findings": Main discoveries from the enrichment analysis.
+     - "2. Mechanism of Action": How the prescription may work for the disease.
+     - Use bolding and bullet points for readability.
+
+Do not include any text outside the JSON object."""
+
+SYSTEM_PROMPT_SINGLE_CLINICAL = """You are a senior clinical diagnostician. Your task is to analyze the provided disease pathway data and generate a structured clinical interview guide.
+
+You must return your response in a strict JSON format. 
+The JSON must be a single list (array) containing exactly ONE object representing this analysis.
+
+The object must contain exactly these keys:
+1. "group_label": A short, descriptive title (e.g., "Prescription Analysis: Key Pathways").
+2. "suspected_driver": A concise summary of the underlying pathology being screened.
+3. "clinical_questions": An array of strings. Each string is a specific high-yield question the doctor should ask the patient. Include 5-8 questions.
+4. "rationale_hidden": A Markdown-formatted string explaining *why* these questions are critical and what the doctor should look for. This will be shown only when requested.
+
+Example Structure:
+[
+  {
+    "group_label": "Prescription Analysis...",
+    "suspected_driver": "...",
+    "clinical_questions": ["Question 1?", "Question 2?", ...],
+    "rationale_hidden": "**Why this matters:** This tests for..."
+  }
+]
+
+Do not include any text outside the JSON array."""
+
+SYSTEM_PROMPT_COMBINED = """You are an expert Research Scientist in pathology and bioinformatics and a senior clinical diagnostician. Your task is to perform a comparative analysis of multiple disease clusters provided by the user and to generate a structured clinical interview guide for them.
+
+You must return your response in a strict JSON format with exactly three keys: "summary_table", "detailed_analysis" and "clinical_questions".
+
+1. "summary_table":
+   - An array of objects representing the rows of a comparison table.
+   - Each object must have the key "Feature" plus one key per group column listed by the user.
+   - Include rows for: "Primary Driver", "Key Tissue", "Main Consequence", and "Cancer Risk".
+   - Keep the values in this table concise (under 10 words).
+
+2. "detailed_analysis":
+   - A single string containing a comprehensive, Markdown-formatted report.
+   - This report must include:
+     - "1. The High-Level Comparison": A brief summary of the fundamental differences.
+     - "2. Deep Dive into Pathways": A detailed breakdown of the mechanism for each group (Group 1, Group 2, Group 3).
+     - Use bolding and bullet points for readability.
+
+3. "clinical_questions":
+   - An array with exactly one object for each prescription group given by the user.
+   - Each object must contain exactly these keys:
+     - "group_label": A short, descriptive title for the group (e.g., "Group 1: Vascular & Tobacco").
+     - "suspected_driver": A concise summary of the underlying pathology (e.g., "Systemic Nicotine Toxicity").
+     - "clinical_questions": An array of strings. Each string is a specific high-yield question the doctor should ask the patient.
+     - "rationale_hidden": A Markdown-formatted string explaining *why* these questions are critical and what the doctor should look for. This will be shown only when requested.
+
+Do not include any text outside the JSON object."""
 
 
 def generate_comparative_analysis(disease_name: str, prescription_data: dict) -> dict:
@@ -193,33 +639,25 @@ def generate_comparative_analysis(disease_name: str, prescription_data: dict) ->
     # Build dynamic column names
     group_columns = ", ".join([f'"Group {i}"' for i in range(1, num_groups + 1)])
     
-    prompt = f"""You are an expert Research Scientist in pathology and bioinformatics. Your task is to perform a comparative analysis of multiple disease clusters provided by the user.
-
-The user is studying **{disease_name}** with the following enrichment analysis results:
+    prompt = f"""The user is studying **{disease_name}** with the following enrichment analysis results:
 
 {all_groups}
 
-You must return your response in a strict JSON format with exactly two keys: "summary_table" and "detailed_analysis".
-
-1. "summary_table":
-   - An array of objects representing the rows of a comparison table.
-   - Each object must have the keys: "Feature", {group_columns}.
-   - Include rows for: "Primary Driver", "Key Tissue", "Main Consequence", and "Cancer Risk".
-   - Keep the values in this table concise (under 10 words).
-
-2. "detailed_analysis":
-   - A single string containing a comprehensive, Markdown-formatted report.
-   - This report must include:
-     - "1. The High-Level Comparison": A brief summary of the fundamental differences.
-     - "2. Deep Dive into Pathways": A detailed breakdown of the mechanism for each group (Group 1, Group 2, Group 3).
-     - Use bolding and bullet points for readability.
-
-Do not include any text outside the JSON object."""
+Group columns for the summary table: {group_columns}."""
 
     # Retry up to 3 times for reliable JSON output
     for attempt in range(1, 4):
         print(f"[LLM] Comparative analysis attempt {attempt}/3")
-        response_text = get_gemini_response(prompt, json_mode=True)
+        try:
+            response_text = get_gemini_response(prompt, json_mode=True, use_cache=(attempt == 1),
+                                                system_instruction=SYSTEM_PROMPT_COMPARATIVE)
+        except LLMTransientError as e:
+            if attempt < 3:
+                _wait_before_retry(attempt, e)
+            continue
+        except LLMTerminalError as e:
+            print(f"[LLM] {e}; not retrying")
+            break
         
         if not response_text:
             continue
@@ -236,6 +674,47 @@ Do not include any text outside the JSON object."""
     return None
 
 
+def generate_combined_analysis(disease_name: str, prescription_data: dict) -> dict:
+    """
+    Generate the comparative analysis and the clinical questions in one request.
+    Returns a dict with summary_table, detailed_analysis and clinical_questions,
+    or None so the caller can fall back to the separate generators.
+    """
+    groups_text = []
+    num_groups = len(prescription_data)
+    
+    for i, (label, data) in enumerate(prescription_data.items(), 1):
+        formatted = format_enrichment_data_for_llm(data)
+        groups_text.append(f"**Group {i} ({label}):**\n{formatted}")
+    
+    all_groups = "\n\n".join(groups_text)
+    group_columns = ", ".join([f'"Group {i}"' for i in range(1, num_groups + 1)])
+    
+    prompt = f"""The user is studying **{disease_name}** with the following enrichment analysis results:
+
+{all_groups}
+
+Group columns for the summary table: {group_columns}.
+Generate exactly {num_groups} clinical question objects, one for each prescription group."""
+
+    # A single attempt: on failure the separate generators (with their own retries) take over
+    print("[LLM] Combined analysis attempt")
+    try:
+        response_text = get_gemini_response(prompt, json_mode=True, system_instruction=SYSTEM_PROMPT_COMBINED,
+                                            max_output_tokens=8192)
+    except LLMError as e:
+        print(f"[LLM] Combined analysis: {e}")
+        return None
+    parsed = extract_json_from_response(response_text)
+    
+    if (parsed and 'summary_table' in parsed and 'detailed_analysis' in parsed
+            and isinstance(parsed.get('clinical_questions'), list) and parsed['clinical_questions']):
+        return parsed
+    
+    print("[LLM] Combined analysis failed to produce valid JSON")
+    return None
+
+
 def _build_comparative_fallback(disease_name: str, prescription_data: dict) -> dict:
     """Build a guaranteed-valid fallback response when LLM fails."""
     num_groups = len(prescription_data)
@@ -272,39 +751,25 @@ def generate_clinical_questions(disease_name: str, prescription_data: dict) -> l
     
     all_groups = "\n\n".join(groups_text)
     
-    prompt = f"""You are a senior clinical diagnostician. Your task is to analyze the provided disease groups and generate a structured clinical interview guide.
-
-The patient is being evaluated for **{disease_name}**. Here are the enrichment analysis results showing associated conditions and pathways:
+    prompt = f"""The patient is being evaluated for **{disease_name}**. Here are the enrichment analysis results showing associated conditions and pathways:
 
 {all_groups}
 
-You must return your response in a strict JSON format. 
-The JSON must be a single list (array) of objects, where each object represents one disease group.
-
-Each object in the list must contain exactly these keys:
-1. "group_label": A short, descriptive title for the group (e.g., "Group 1: Vascular & Tobacco").
-2. "suspected_driver": A concise summary of the underlying pathology (e.g., "Systemic Nicotine Toxicity").
-3. "clinical_questions": An array of strings. Each string is a specific high-yield question the doctor should ask the patient.
-4. "rationale_hidden": A Markdown-formatted string explaining *why* these questions are critical and what the doctor should look for. This will be shown only when requested.
-
-Example Structure:
-[
-  {{
-    "group_label": "Group 1...",
-    "suspected_driver": "...",
-    "clinical_questions": ["Question 1?", "Question 2?"],
-    "rationale_hidden": "**Why this matters:** This tests for..."
-  }}
-]
-
-Generate exactly {num_groups} group objects, one for each prescription group.
-
-Do not include any text outside the JSON array."""
+Generate exactly {num_groups} group objects, one for each prescription group."""
 
     # Retry up to 3 times for reliable JSON output
     for attempt in range(1, 4):
         print(f"[LLM] Clinical questions attempt {attempt}/3")
-        response_text = get_gemini_response(prompt, json_mode=True)
+        try:
+            response_text = get_gemini_response(prompt, json_mode=True, use_cache=(attempt == 1),
+                                                system_instruction=SYSTEM_PROMPT_CLINICAL)
+        except LLMTransientError as e:
+            if attempt < 3:
+                _wait_before_retry(attempt, e)
+            continue
+        except LLMTerminalError as e:
+            print(f"[LLM] {e}; not retrying")
+            break
         
         if not response_text:
             continue
@@ -348,21 +813,29 @@ def extract_json_array_from_response(text: str) -> list:
     if not text:
         return None
     
+    # Fast path: the response is already a clean JSON array
+    try:
+        parsed = orjson.loads(text)
+        if isinstance(parsed, list):
+            return parsed
+    except orjson.JSONDecodeError:
+        pass
+    
     # Try to find JSON in code blocks first
-    json_match = re.search(r'```(?:json)?\s*([\s\S]*?)\s*```', text)
+    json_match = _RE_JSON_BLOCK.search(text)
     if json_match:
         json_str = json_match.group(1)
     else:
         # Try to find raw JSON array
-        json_match = re.search(r'\[[\s\S]*\]', text)
+        json_match = _RE_JSON_ARR.search(text)
         if json_match:
             json_str = json_match.group(0)
         else:
             return None
     
     try:
-        return json.loads(json_str)
-    except json.JSONDecodeError as e:
+        return orjson.loads(json_str)
+    except orjson.JSONDecodeError as e:
         print(f"JSON parse error: {e}")
         return None
 
@@ -373,30 +846,24 @@ def generate_single_prescription_analysis(disease_name: str, enrichment_data: li
     """
     formatted_data = format_enrichment_data_for_llm(enrichment_data)
     
-    prompt = f"""You are an expert Research Scientist in pathology and bioinformatics. Analyze the gene enrichment results for a traditional Chinese medicine prescription targeting **{disease_name}**.
+    prompt = f"""Disease: **{disease_name}**
 
 Enrichment Results:
-{formatted_data}
-
-You must return your response in a strict JSON format with exactly two keys: "summary_table" and "detailed_analysis".
-
-1. "summary_table":
-   - An array of objects with keys: "Feature", "Finding".
-   - Include rows for: "Primary Driver", "Key Tissue", "Main Consequence", "Cancer Risk".
-   - Keep values concise (under 10 words).
-
-2. "detailed_analysis":
-   - A Markdown-formatted report including:
-     - "1. Key Findings": Main discoveries from the enrichment analysis.
-     - "2. Mechanism of Action": How the prescription may work for {disease_name}.
-     - Use bolding and bullet points for readability.
-
-Do not include any text outside the JSON object."""
+{formatted_data}"""
 
     # Retry up to 3 times
     for attempt in range(1, 4):
         print(f"[LLM] Single prescription analysis attempt {attempt}/3")
-        response_text = get_gemini_response(prompt, json_mode=True)
+        try:
+            response_text = get_gemini_response(prompt, json_mode=True, use_cache=(attempt == 1),
+                                                system_instruction=SYSTEM_PROMPT_SINGLE_ANALYSIS)
+        except LLMTransientError as e:
+            if attempt < 3:
+                _wait_before_retry(attempt, e)
+            continue
+        except LLMTerminalError as e:
+            print(f"[LLM] {e}; not retrying")
+            break
         
         if not response_text:
             continue
@@ -420,37 +887,23 @@ def generate_single_clinical_questions(disease_name: str, enrichment_data: list)
     """
     formatted_data = format_enrichment_data_for_llm(enrichment_data, top_n=8)
     
-    prompt = f"""You are a senior clinical diagnostician. Your task is to analyze the provided disease pathway data and generate a structured clinical interview guide.
-
-The patient is being evaluated for **{disease_name}**. Here are the enrichment analysis results:
-
-{formatted_data}
-
-You must return your response in a strict JSON format. 
-The JSON must be a single list (array) containing exactly ONE object representing this analysis.
-
-The object must contain exactly these keys:
-1. "group_label": A short, descriptive title (e.g., "Prescription Analysis: Key Pathways").
-2. "suspected_driver": A concise summary of the underlying pathology being screened.
-3. "clinical_questions": An array of strings. Each string is a specific high-yield question the doctor should ask the patient. Include 5-8 questions.
-4. "rationale_hidden": A Markdown-formatted string explaining *why* these questions are critical and what the doctor should look for. This will be shown only when requested.
-
-Example Structure:
-[
-  {{
-    "group_label": "Prescription Analysis...",
-    "suspected_driver": "...",
-    "clinical_questions": ["Question 1?", "Question 2?", ...],
-    "rationale_hidden": "**Why this matters:** This tests for..."
-  }}
-]
+    prompt = f"""The patient is being evaluated for **{disease_name}**. Here are the enrichment analysis results:
 
-Do not include any text outside the JSON array."""
+{formatted_data}"""
 
     # Retry up to 3 times
     for attempt in range(1, 4):
         print(f"[LLM] Single clinical questions attempt {attempt}/3")
-        response_text = get_gemini_response(prompt, json_mode=True)
+        try:
+            response_text = get_gemini_response(prompt, json_mode=True, use_cache=(attempt == 1),
+                                                system_instruction=SYSTEM_PROMPT_SINGLE_CLINICAL)
+        except LLMTransientError as e:
+            if attempt < 3:
+                _wait_before_retry(attempt, e)
+            continue
+        except LLMTerminalError as e:
+            print(f"[LLM] {e}; not retrying")
+            break
         
         if not response_text:
             continue
@@ -467,6 +920,14 @@ Do not include any text outside the JSON array."""
     return None
 
 
+def _run_analysis_pair(analysis_fn, clinical_fn, disease_name: str, data) -> tuple:
+    """Run an analysis generator and its clinical-question generator concurrently."""
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        analysis_future = executor.submit(analysis_fn, disease_name, data)
+        clinical_future = executor.submit(clinical_fn, disease_name, data)
+        return analysis_future.result(), clinical_future.result()
+
+
 def generate_full_ai_analysis(disease_name: str, results: dict) -> dict:
     """
     Generate complete AI analysis with:
@@ -495,19 +956,17 @@ def generate_full_ai_analysis(disease_name: str, results: dict) -> dict:
     prescription_enrichments = results.get('prescription_enrichments', {})
     print(f"[LLM] Found {len(prescription_enrichments)} prescription enrichments")
     
+    # (prescription label, DisGeNET rows) pairs, extracted once
+    rx_items = [(rx_key, rx_data.get('DisGeNET', [])) for rx_key, rx_data in prescription_enrichments.items()]
+    
     # Debug: Print structure of enrichment data
-    for rx_key, rx_data in prescription_enrichments.items():
-        disgenet_data = rx_data.get('DisGeNET', [])
+    for rx_key, disgenet_data in rx_items:
         print(f"[LLM] {rx_key}: {len(disgenet_data)} DisGeNET entries")
     
-    if len(prescription_enrichments) > 1:
+    if len(rx_items) > 1:
         # Multiple prescriptions submitted - filter to those with enrichment data
         print("[LLM] Processing multiple prescriptions")
-        prescription_data = {}
-        for rx_key, rx_data in prescription_enrichments.items():
-            rx_disgenet = rx_data.get('DisGeNET', [])
-            if rx_disgenet:
-                prescription_data[rx_key] = rx_disgenet
+        prescription_data = {rx_key: rx_disgenet for rx_key, rx_disgenet in rx_items if rx_disgenet}
         
         if len(prescription_data) > 1:
             # Multiple prescriptions have enrichment data → comparative analysis
@@ -516,7 +975,14 @@ def generate_full_ai_analysis(disease_name: str, results: dict) -> dict:
             # Map Group N → Prescription label for frontend column headers
             ai_results['group_mapping'] = {f"Group {i}": label for i, label in enumerate(rx_labels, 1)}
             print(f"[LLM] Running comparative analysis for {len(prescription_data)} groups")
-            analysis = generate_comparative_analysis(disease_name, prescription_data)
+            # One round trip for both parts; the separate calls are the fallback
+            analysis = generate_combined_analysis(disease_name, prescription_data)
+            if analysis:
+                clinical = analysis['clinical_questions']
+            else:
+                analysis, clinical = _run_analysis_pair(
+                    generate_comparative_analysis, generate_clinical_questions, disease_name, prescription_data
+                )
             if analysis:
                 ai_results['summary_table'] = analysis.get('summary_table', [])
                 ai_results['detailed_analysis'] = analysis.get('detailed_analysis', '')
@@ -526,20 +992,19 @@ def generate_full_ai_analysis(disease_name: str, results: dict) -> dict:
                 ai_results['error'] = "Failed to generate comparative analysis"
                 print("[LLM] Comparative analysis returned None")
             
-            # Generate clinical questions
-            clinical = generate_clinical_questions(disease_name, prescription_data)
             if clinical:
                 ai_results['clinical_questions'] = clinical
         
         elif len(prescription_data) == 1:
             # Only 1 prescription has enrichment data → single prescription analysis
-            rx_key = list(prescription_data.keys())[0]
-            rx_data = prescription_data[rx_key]
+            rx_key, rx_data = next(iter(prescription_data.items()))
             ai_results['analysis_scope'] = f"{rx_key} only"
             ai_results['group_mapping'] = {"Finding": rx_key}
             print(f"[LLM] Only {rx_key} has enrichment data ({len(rx_data)} entries) — running single prescription analysis")
             
-            analysis = generate_single_prescription_analysis(disease_name, rx_data)
+            analysis, clinical = _run_analysis_pair(
+                generate_single_prescription_analysis, generate_single_clinical_questions, disease_name, rx_data
+            )
             if analysis:
                 ai_results['summary_table'] = analysis.get('summary_table', [])
                 ai_results['detailed_analysis'] = analysis.get('detailed_analysis', '')
@@ -549,7 +1014,6 @@ def generate_full_ai_analysis(disease_name: str, results: dict) -> dict:
                 ai_results['error'] = "Failed to generate analysis"
                 print("[LLM] Single prescription analysis returned None")
             
-            clinical = generate_single_clinical_questions(disease_name, rx_data)
             if clinical:
                 ai_results['clinical_questions'] = clinical
         
@@ -557,17 +1021,18 @@ def generate_full_ai_analysis(disease_name: str, results: dict) -> dict:
             ai_results['error'] = "No valid enrichment data in any prescription"
             print("[LLM] Error: No valid enrichment data in prescriptions")
     
-    elif len(prescription_enrichments) == 1:
+    elif len(rx_items) == 1:
         # Single prescription analysis
-        rx_key = list(prescription_enrichments.keys())[0]
-        rx_data = prescription_enrichments[rx_key].get('DisGeNET', [])
+        rx_key, rx_data = rx_items[0]
         ai_results['analysis_scope'] = rx_key
         ai_results['group_mapping'] = {"Finding": rx_key}
         print(f"[LLM] Single prescription mode: {rx_key} with {len(rx_data)} enrichment entries")
         
         if rx_data:
-            # Generate single analysis
-            analysis = generate_single_prescription_analysis(disease_name, rx_data)
+            # Generate single analysis and clinical questions in parallel
+            analysis, clinical = _run_analysis_pair(
+                generate_single_prescription_analysis, generate_single_clinical_questions, disease_name, rx_data
+            )
             if analysis:
                 ai_results['summary_table'] = analysis.get('summary_table', [])
                 ai_results['detailed_analysis'] = analysis.get('detailed_analysis', '')
@@ -576,8 +1041,6 @@ def generate_full_ai_analysis(disease_name: str, results: dict) -> dict:
             else:
                 print("[LLM] Single prescription analysis returned None")
             
-            # Generate clinical questions
-            clinical = generate_single_clinical_questions(disease_name, rx_data)
             if clinical:
                 ai_results['clinical_questions'] = clinical
         else:
@@ -594,13 +1057,14 @@ def generate_full_ai_analysis(disease_name: str, results: dict) -> dict:
         
         if disgenet_results:
             print(f"[LLM] Using fallback enrichment data: {len(disgenet_results)} entries")
-            analysis = generate_single_prescription_analysis(disease_name, disgenet_results)
+            analysis, clinical = _run_analysis_pair(
+                generate_single_prescription_analysis, generate_single_clinical_questions, disease_name, disgenet_results
+            )
             if analysis:
                 ai_results['summary_table'] = analysis.get('summary_table', [])
                 ai_results['detailed_analysis'] = analysis.get('detailed_analysis', '')
                 ai_results['has_ai_analysis'] = True
             
-            clinical = generate_single_clinical_questions(disease_name, disgenet_results)
             if clinical:
                 ai_results['clinical_questions'] = clinical
         else:
@@ -10,13 +10,16 @@ db = SQLAlchemy()
 class Disease(db.Model):
     """Model representing disease-gene associations from DisGeNET."""
     __tablename__ = 'diseases'
+    __table_args__ = (
+        db.Index('ix_disease_gene_disease', 'geneId', 'diseaseId'),
+    )
     
     Serial_Number_D = db.Column(db.Integer, primary_key=True, autoincrement=True)
     geneNID = db.Column(db.Text)
     diseaseNID = db.Column(db.Text)
-    diseaseId = db.Column(db.Text)
-    geneId = db.Column(db.Text)
-    diseaseName = db.Column(db.Text)
+    diseaseId = db.Column(db.Text, index=True)
+    geneId = db.Column(db.Text, index=True)
+    diseaseName = db.Column(db.Text, index=True)
     geneName = db.Column(db.Text)
     score = db.Column(db.Text)
     
@@ -24,21 +27,55 @@ class Disease(db.Model):
         return f'<Disease {self.diseaseName} - Gene {self.geneName}>'
 
 
+# Case-insensitive name lookups filter on lower(diseaseName), which a plain index can't serve;
+# geneName follows so a disease's gene listing is read in order instead of sorted per request
+db.Index('ix_disease_lower_name_gene', db.func.lower(Disease.diseaseName), Disease.geneName)
+
+
 class Herb(db.Model):
     """Model representing herb-gene associations from BATMAN-TCM."""
     __tablename__ = 'herbs'
+    __table_args__ = (
+        db.Index('ix_herb_herb_gene', 'herbName', 'GeneId'),
+    )
     
     Serial_Number_H = db.Column(db.Integer, primary_key=True, autoincrement=True)
     Compound = db.Column(db.Text)
     TCMID_ID = db.Column(db.Text)
-    Genes = db.Column(db.Text)
-    GeneId = db.Column(db.Text)
-    herbName = db.Column(db.Text)
+    Genes = db.Column(db.Text, index=True)
+    GeneId = db.Column(db.Text, index=True)
+    herbName = db.Column(db.Text)  # indexed as the leading column of ix_herb_herb_gene
     
     def __repr__(self):
         return f'<Herb {self.herbName} - Gene {self.Genes}>'
 
 
+db.Index('ix_herb_lower_name_compound', db.func.lower(Herb.herbName), Herb.Compound, Herb.Genes)
+
+
+class DiseaseSummary(db.Model):
+    """Per-disease gene counts, precomputed from diseases for the database listing."""
+    __tablename__ = 'disease_summary'
+    
+    diseaseName = db.Column(db.String(255), primary_key=True)
+    gene_count = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<DiseaseSummary {self.diseaseName} - {self.gene_count} genes>'
+
+
+class HerbSummary(db.Model):
+    """Per-herb gene and compound counts, precomputed from herbs for the database listing."""
+    __tablename__ = 'herb_summary'
+    
+    herbName = db.Column(db.String(255), primary_key=True)
+    gene_count = db.Column(db.Integer, nullable=False, default=0)
+    compound_count = db.Column(db.Integer, nullable=False, default=0)
+    
+    def __repr__(self):
+        return f'<HerbSummary {self.herbName} - {self.gene_count} genes>'
+
+
 class AnalysisResult(db.Model):
     """Model for storing analysis results history."""
     __tablename__ = 'analysis_results'
@@ -49,7 +86,14 @@ class AnalysisResult(db.Model):
     results_json = db.Column(db.Text, nullable=False)   # Full results as JSON
     ai_analysis_json = db.Column(db.Text, nullable=True)  # AI analysis results (Gemini)
     common_genes_count = db.Column(db.Integer, default=0)
+    prescriptions_count = db.Column(db.Integer, nullable=True)  # Denormalized for the history list
+    herbs_count = db.Column(db.Integer, nullable=True)
+    input_hash = db.Column(db.String(64), index=True)  # SHA-256 of the inputs, set on complete results
     created_at = db.Column(db.DateTime, default=datetime.utcnow)
     
     def __repr__(self):
-        return f'<AnalysisResult {self.disease_name} - {self.created_at}>'
\ No newline at end of file
+        return f'<AnalysisResult {self.disease_name} - {self.created_at}>'
+
+
+# History is listed newest first
+db.Index('ix_analysis_results_created_at', AnalysisResult.created_at.desc())
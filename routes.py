@@ -1,23 +1,28 @@
 """
 Flask routes for the Disease Portal application.
 """
-import json
+import heapq
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from functools import wraps
 
 # Korea Standard Time (UTC+9)
 KST = timezone(timedelta(hours=9))
-from flask import Blueprint, render_template, request, redirect, url_for, jsonify, session, flash
-from sqlalchemy import func, desc, text
-from sqlalchemy.orm import sessionmaker
-from sqlalchemy import create_engine
-from models import Disease, Herb, AnalysisResult
-from services import analyze_prescriptions
+from flask import Blueprint, Response, render_template, request, redirect, url_for, jsonify, session, flash
+from sqlalchemy import func, desc, literal, text, select, insert
+from sqlalchemy.orm import load_only
+from models import Disease, Herb, AnalysisResult, DiseaseSummary, HerbSummary
+from services import analyze_prescriptions, get_all_herb_names, rebuild_summary_tables
 from config import Config
-from llm_service import generate_full_ai_analysis
+from extensions import cache, engine, db_session
+import json_utils
+from llm_service import generate_full_ai_analysis, get_api_key
 from herb_mappings import (
     search_herbs_bilingual, 
     validate_herb_bilingual, 
+    match_english_names,
+    classify_query,
     get_korean_name,
     get_english_name,
     KOREAN_TO_ENGLISH
@@ -26,9 +31,10 @@ from herb_mappings import (
 # Create blueprint
 main_bp = Blueprint('main', __name__)
 
-# Create engine and session
-engine = create_engine(Config.SQLALCHEMY_DATABASE_URI)
-Session = sessionmaker(bind=engine)
+@main_bp.teardown_app_request
+def remove_db_session(exc=None):
+    """Close the request's session and return its connection to the pool."""
+    db_session.remove()
 
 
 # Login required decorator
@@ -41,41 +47,207 @@ def login_required(f):
     return decorated_function
 
 
-# Ensure the analysis_results table has the ai_analysis_json column
-def init_results_table():
-    """Create/update the analysis_results table."""
-    from sqlalchemy import MetaData, Table, Column, Integer, Text, DateTime, inspect
-    
-    inspector = inspect(engine)
-    
-    # Check if table exists
-    if 'analysis_results' in inspector.get_table_names():
-        # Check if ai_analysis_json column exists
-        columns = [col['name'] for col in inspector.get_columns('analysis_results')]
-        if 'ai_analysis_json' not in columns:
-            # Add the column
-            with engine.connect() as conn:
-                conn.execute(text("ALTER TABLE analysis_results ADD COLUMN ai_analysis_json TEXT"))
-                conn.commit()
-                print("[DB] Added ai_analysis_json column to analysis_results table")
-    else:
-        # Create the table
-        metadata = MetaData()
-        analysis_results = Table(
-            'analysis_results', metadata,
-            Column('id', Integer, primary_key=True, autoincrement=True),
-            Column('disease_name', Text, nullable=False),
-            Column('prescriptions', Text, nullable=False),
-            Column('results_json', Text, nullable=False),
-            Column('ai_analysis_json', Text, nullable=True),
-            Column('common_genes_count', Integer, default=0),
-            Column('created_at', DateTime, default=datetime.utcnow)
+# Columns added to analysis_results after it was first deployed
+RESULTS_TABLE_ADDED_COLUMNS = {
+    'ai_analysis_json': 'TEXT',
+    'prescriptions_count': 'INTEGER',
+    'herbs_count': 'INTEGER',
+    'input_hash': 'VARCHAR(64)',
+}
+
+
+def _backfill_prescription_counts(conn):
+    """Fill prescriptions_count/herbs_count for rows saved before the columns existed."""
+    rows = conn.execute(text(
+        "SELECT id, prescriptions FROM analysis_results WHERE prescriptions_count IS NULL"
+    )).all()
+    for result_id, prescriptions_json in rows:
+        try:
+            prescriptions = json_utils.loads(prescriptions_json)
+            herbs_count = sum(len(p) for p in prescriptions)
+        except (ValueError, TypeError):
+            # Malformed or non-list JSON (orjson's decode error is a ValueError)
+            prescriptions = []
+            herbs_count = 0
+        conn.execute(
+            text("UPDATE analysis_results SET prescriptions_count = :p, herbs_count = :h WHERE id = :id"),
+            {'p': len(prescriptions), 'h': herbs_count, 'id': result_id}
         )
-        metadata.create_all(engine)
-        print("[DB] Created analysis_results table")
+    if rows:
+        print(f"[DB] Backfilled prescription counts for {len(rows)} saved results")
+
+
+# Ensure the analysis_results table has all current columns
+def init_results_table():
+    """Create/update the analysis_results table with idempotent DDL (no schema reflection)."""
+    from sqlalchemy import MetaData, Table, Column, Integer, String, Text, DateTime
+    from sqlalchemy.schema import CreateTable
+    
+    metadata = MetaData()
+    analysis_results = Table(
+        'analysis_results', metadata,
+        Column('id', Integer, primary_key=True, autoincrement=True),
+        Column('disease_name', Text, nullable=False),
+        Column('prescriptions', Text, nullable=False),
+        Column('results_json', Text, nullable=False),
+        Column('ai_analysis_json', Text, nullable=True),
+        Column('common_genes_count', Integer, default=0),
+        Column('prescriptions_count', Integer, nullable=True),
+        Column('herbs_count', Integer, nullable=True),
+        Column('input_hash', String(64), nullable=True),
+        Column('created_at', DateTime, default=datetime.utcnow)
+    )
+    
+    with engine.begin() as conn:
+        conn.execute(CreateTable(analysis_results, if_not_exists=True))
+        
+        # Add any columns this version expects but an older table lacks
+        if engine.dialect.name == 'sqlite':
+            # SQLite has no ADD COLUMN IF NOT EXISTS; PRAGMA table_info is a local read
+            columns = {row[1] for row in conn.execute(text("PRAGMA table_info(analysis_results)"))}
+            for name, column_type in RESULTS_TABLE_ADDED_COLUMNS.items():
+                if name not in columns:
+                    conn.execute(text(f"ALTER TABLE analysis_results ADD COLUMN {name} {column_type}"))
+                    print(f"[DB] Added {name} column to analysis_results table")
+        else:
+            for name, column_type in RESULTS_TABLE_ADDED_COLUMNS.items():
+                conn.execute(text(f"ALTER TABLE analysis_results ADD COLUMN IF NOT EXISTS {name} {column_type}"))
+        
+        # Only touches rows saved before the count columns existed
+        _backfill_prescription_counts(conn)
+
+
+# Indexes replaced by wider ones declared on the models (ix_herbs_herbName duplicated
+# the leading column of ix_herb_herb_gene)
+SUPERSEDED_INDEXES = ('ix_disease_lower_name', 'ix_herb_lower_name', 'ix_herbs_herbName')
+
+
+# Build the lookup indexes declared on the models for databases created before they existed
+def init_lookup_indexes():
+    """Create any missing indexes on the diseases, herbs and analysis_results tables."""
+    from sqlalchemy import inspect
+    from sqlalchemy.schema import CreateIndex
+    
+    existing_tables = inspect(engine).get_table_names()
+    with engine.begin() as conn:
+        for model in (Disease, Herb, AnalysisResult):
+            if model.__tablename__ not in existing_tables:
+                continue
+            for index in model.__table__.indexes:
+                # IF NOT EXISTS makes this cheap after the first run (reflection can't see
+                # expression indexes on SQLite, so checkfirst would try to recreate them)
+                conn.execute(CreateIndex(index, if_not_exists=True))
+        
+        # Single-column indexes, now leading columns of the composite ones above
+        # (quoted: PostgreSQL folds unquoted names, and ix_herbs_herbName is mixed case)
+        for name in SUPERSEDED_INDEXES:
+            conn.execute(text(f'DROP INDEX IF EXISTS "{name}"'))
+    
+    # PostgreSQL: trigram indexes let ILIKE '%term%' searches use an index
+    if engine.dialect.name == 'postgresql':
+        try:
+            with engine.begin() as conn:
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                conn.execute(text(
+                    'CREATE INDEX IF NOT EXISTS ix_disease_name_trgm ON diseases USING gin ("diseaseName" gin_trgm_ops)'
+                ))
+                conn.execute(text(
+                    'CREATE INDEX IF NOT EXISTS ix_herb_name_trgm ON herbs USING gin ("herbName" gin_trgm_ops)'
+                ))
+        except Exception as e:
+            # The extension needs privileges some hosts don't grant; searches still work without it
+            print(f"[DB] Skipped trigram indexes: {e}")
+    
+    # SQLite: a trigram FTS5 table over disease names serves the suggestion substring search
+    elif engine.dialect.name == 'sqlite' and 'diseases' in existing_tables:
+        init_disease_name_fts(DISEASE_NAME_FTS not in existing_tables)
+
+
+# SQLite full-text index mirroring diseases."diseaseName" (external content, kept in sync by triggers)
+DISEASE_NAME_FTS = 'disease_name_fts'
+_disease_name_fts_ready = False
+
+_DISEASE_NAME_FTS_DDL = (
+    f"""CREATE VIRTUAL TABLE IF NOT EXISTS {DISEASE_NAME_FTS} USING fts5(
+        "diseaseName", content='diseases', content_rowid='Serial_Number_D', tokenize='trigram'
+    )""",
+    f"""CREATE TRIGGER IF NOT EXISTS {DISEASE_NAME_FTS}_ai AFTER INSERT ON diseases BEGIN
+        INSERT INTO {DISEASE_NAME_FTS}(rowid, "diseaseName") VALUES (new."Serial_Number_D", new."diseaseName");
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {DISEASE_NAME_FTS}_ad AFTER DELETE ON diseases BEGIN
+        INSERT INTO {DISEASE_NAME_FTS}({DISEASE_NAME_FTS}, rowid, "diseaseName") VALUES ('delete', old."Serial_Number_D", old."diseaseName");
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS {DISEASE_NAME_FTS}_au AFTER UPDATE ON diseases BEGIN
+        INSERT INTO {DISEASE_NAME_FTS}({DISEASE_NAME_FTS}, rowid, "diseaseName") VALUES ('delete', old."Serial_Number_D", old."diseaseName");
+        INSERT INTO {DISEASE_NAME_FTS}(rowid, "diseaseName") VALUES (new."Serial_Number_D", new."diseaseName");
+    END""",
+)
+
 
-# Initialize table on import
-init_results_table()
+def init_disease_name_fts(build: bool):
+    """Create the disease name FTS5 table and its triggers; build=True indexes the existing rows."""
+    global _disease_name_fts_ready
+    try:
+        with engine.begin() as conn:
+            for statement in _DISEASE_NAME_FTS_DDL:
+                conn.execute(text(statement))
+            if build:
+                conn.execute(text(f"INSERT INTO {DISEASE_NAME_FTS}({DISEASE_NAME_FTS}) VALUES ('rebuild')"))
+                print(f"[DB] Built {DISEASE_NAME_FTS} index")
+        _disease_name_fts_ready = True
+    except Exception as e:
+        # Older SQLite builds lack FTS5 or the trigram tokenizer; suggestions then scan the table
+        print(f"[DB] Skipped disease name FTS index: {e}")
+
+
+# Derived tables no longer read by any query
+SUPERSEDED_SUMMARY_TABLES = ('herb_gene_lists',)
+
+
+def init_summary_tables():
+    """Create the listing summary tables, filling them when they are new or empty."""
+    from sqlalchemy.schema import CreateTable
+    
+    with engine.begin() as conn:
+        # Nothing to summarize on a database without the source tables
+        if not all(engine.dialect.has_table(conn, name) for name in ('diseases', 'herbs')):
+            return
+        summary_models = (DiseaseSummary, HerbSummary)
+        for model in summary_models:
+            conn.execute(CreateTable(model.__table__, if_not_exists=True))
+        for name in SUPERSEDED_SUMMARY_TABLES:
+            conn.execute(text(f'DROP TABLE IF EXISTS {name}'))
+        
+        # A table added in a later release starts empty next to already-filled ones
+        if any(conn.execute(select(literal(1)).select_from(model).limit(1)).first() is None
+               for model in summary_models):
+            rebuild_summary_tables(conn)
+            print("[DB] Built disease_summary and herb_summary tables")
+
+
+def init_database():
+    """Run the startup schema checks once per process (called from create_app, not on import)."""
+    if getattr(init_database, '_done', False):
+        return
+    init_results_table()
+    init_lookup_indexes()
+    init_summary_tables()
+    init_database._done = True
+
+
+def _page_with_total(query, page: int, per_page: int) -> tuple:
+    """
+    Fetch one page of an ordered query and the total row count in one round trip.
+    The total comes from a COUNT(*) OVER () window column, which is appended to each row.
+    """
+    rows = query.add_columns(func.count().over().label('total'))\
+        .offset((page - 1) * per_page)\
+        .limit(per_page)\
+        .all()
+    if rows:
+        return rows, rows[0].total
+    # Past the last page no row carries the total, so count separately
+    return rows, (query.count() if page > 1 else 0)
 
 
 @main_bp.route('/login', methods=['GET', 'POST'])
@@ -129,75 +301,61 @@ def about():
     return render_template('about.html')
 
 
+def _is_search_request() -> bool:
+    """True for filtered listings, which are too varied to be worth caching."""
+    return bool(request.args.get('search', '').strip())
+
+
 @main_bp.route('/api/database/diseases')
+@cache.cached(query_string=True, unless=_is_search_request)
 def get_diseases_paginated():
     """API endpoint to get paginated diseases data."""
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 50, type=int)
     search = request.args.get('search', '').strip()
     
-    session = Session()
-    try:
-        query = session.query(
-            Disease.diseaseName,
-            func.count(Disease.geneName).label('gene_count')
-        ).group_by(Disease.diseaseName)
-        
-        if search:
-            query = query.filter(Disease.diseaseName.ilike(f'%{search}%'))
-        
-        total = query.count()
-        
-        diseases = query.order_by(Disease.diseaseName)\
-            .offset((page - 1) * per_page)\
-            .limit(per_page)\
-            .all()
-        
-        return jsonify({
-            'data': [{'name': d[0], 'gene_count': d[1]} for d in diseases],
-            'total': total,
-            'page': page,
-            'per_page': per_page,
-            'total_pages': (total + per_page - 1) // per_page
-        })
-    finally:
-        session.close()
+    session = db_session()
+    # Gene counts are precomputed per disease, so a page is an ordered range of the summary table
+    query = session.query(DiseaseSummary.diseaseName, DiseaseSummary.gene_count)
+    
+    if search:
+        query = query.filter(DiseaseSummary.diseaseName.ilike(f'%{search}%'))
+    
+    diseases, total = _page_with_total(query.order_by(DiseaseSummary.diseaseName), page, per_page)
+    
+    return jsonify({
+        'data': [{'name': d[0], 'gene_count': d[1]} for d in diseases],
+        'total': total,
+        'page': page,
+        'per_page': per_page,
+        'total_pages': (total + per_page - 1) // per_page
+    })
 
 
 @main_bp.route('/api/database/herbs')
+@cache.cached(query_string=True, unless=_is_search_request)
 def get_herbs_paginated():
     """API endpoint to get paginated herbs data."""
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 50, type=int)
     search = request.args.get('search', '').strip()
     
-    session = Session()
-    try:
-        query = session.query(
-            Herb.herbName,
-            func.count(Herb.Genes).label('gene_count'),
-            func.count(func.distinct(Herb.Compound)).label('compound_count')
-        ).group_by(Herb.herbName)
-        
-        if search:
-            query = query.filter(Herb.herbName.ilike(f'%{search}%'))
-        
-        total = query.count()
-        
-        herbs = query.order_by(Herb.herbName)\
-            .offset((page - 1) * per_page)\
-            .limit(per_page)\
-            .all()
-        
-        return jsonify({
-            'data': [{'name': h[0], 'gene_count': h[1], 'compound_count': h[2]} for h in herbs],
-            'total': total,
-            'page': page,
-            'per_page': per_page,
-            'total_pages': (total + per_page - 1) // per_page
-        })
-    finally:
-        session.close()
+    session = db_session()
+    # Gene/compound counts are precomputed per herb (see init_summary_tables)
+    query = session.query(HerbSummary.herbName, HerbSummary.gene_count, HerbSummary.compound_count)
+    
+    if search:
+        query = query.filter(HerbSummary.herbName.ilike(f'%{search}%'))
+    
+    herbs, total = _page_with_total(query.order_by(HerbSummary.herbName), page, per_page)
+    
+    return jsonify({
+        'data': [{'name': h[0], 'gene_count': h[1], 'compound_count': h[2]} for h in herbs],
+        'total': total,
+        'page': page,
+        'per_page': per_page,
+        'total_pages': (total + per_page - 1) // per_page
+    })
 
 
 @main_bp.route('/api/database/disease/<disease_name>/genes')
@@ -206,69 +364,78 @@ def get_disease_genes(disease_name):
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 50, type=int)
     
-    session = Session()
-    try:
-        query = session.query(Disease.geneName, Disease.geneId, Disease.score).filter(
-            func.lower(Disease.diseaseName) == disease_name.lower()
-        )
-        
-        total = query.count()
-        
-        genes = query.order_by(Disease.geneName)\
-            .offset((page - 1) * per_page)\
-            .limit(per_page)\
-            .all()
-        
-        return jsonify({
-            'disease': disease_name,
-            'data': [{'gene': g[0], 'gene_id': g[1], 'score': g[2]} for g in genes],
-            'total': total,
-            'page': page,
-            'per_page': per_page,
-            'total_pages': (total + per_page - 1) // per_page
-        })
-    finally:
-        session.close()
+    session = db_session()
+    query = session.query(Disease.geneName, Disease.geneId, Disease.score).filter(
+        func.lower(Disease.diseaseName) == disease_name.lower()
+    )
+    
+    genes, total = _page_with_total(query.order_by(Disease.geneName), page, per_page)
+    
+    return jsonify({
+        'disease': disease_name,
+        'data': [{'gene': g[0], 'gene_id': g[1], 'score': g[2]} for g in genes],
+        'total': total,
+        'page': page,
+        'per_page': per_page,
+        'total_pages': (total + per_page - 1) // per_page
+    })
+
+
+# Herb genes grouped by compound, keyed by "is SQLite". Genes keep their (Compound, Genes)
+# order: SQLite aggregates an ordered subquery, PostgreSQL orders inside json_agg.
+_HERB_GENES_SQL = {
+    True: text(
+        """SELECT "Compound", json_group_array(json_object('gene', "Genes", 'gene_id', "GeneId")), COUNT(*)
+           FROM (SELECT "Compound", "Genes", "GeneId" FROM herbs
+                 WHERE lower("herbName") = :h ORDER BY "Compound", "Genes")
+           GROUP BY "Compound" ORDER BY "Compound"
+        """
+    ),
+    False: text(
+        """SELECT "Compound", json_agg(json_build_object('gene', "Genes", 'gene_id', "GeneId") ORDER BY "Genes"), COUNT(*)
+           FROM herbs WHERE lower("herbName") = :h
+           GROUP BY "Compound" ORDER BY "Compound"
+        """
+    ),
+}
 
 
 @main_bp.route('/api/database/herb/<herb_name>/genes')
 def get_herb_genes(herb_name):
-    """API endpoint to get genes for a specific herb, grouped by compound."""
-    session = Session()
-    try:
-        # Get all genes for this herb
-        records = session.query(Herb.Compound, Herb.Genes, Herb.GeneId).filter(
-            func.lower(Herb.herbName) == herb_name.lower()
-        ).order_by(Herb.Compound, Herb.Genes).all()
-        
-        # Group by compound
-        compounds_dict = {}
-        for compound, gene, gene_id in records:
-            if compound not in compounds_dict:
-                compounds_dict[compound] = []
-            compounds_dict[compound].append({
-                'gene': gene,
-                'gene_id': gene_id
-            })
-        
-        # Convert to list format
-        compounds_list = [
-            {
-                'compound': compound,
-                'genes': genes,
-                'gene_count': len(genes)
-            }
-            for compound, genes in compounds_dict.items()
-        ]
-        
-        return jsonify({
-            'herb': herb_name,
-            'compounds': compounds_list,
-            'total_compounds': len(compounds_list),
-            'total_genes': len(records)
-        })
-    finally:
-        session.close()
+    """API endpoint to get genes for a specific herb, grouped by compound (streamed)."""
+    is_sqlite = engine.dialect.name == 'sqlite'
+    
+    def generate():
+        conn = engine.connect()
+        try:
+            # One row per compound, with its genes aggregated into a JSON array by the database.
+            # Rows are fetched in batches and written out as they arrive, so a large herb is
+            # never held in memory as a whole; keys are emitted in jsonify's sorted order.
+            result = conn.execution_options(yield_per=1000).execute(
+                _HERB_GENES_SQL[is_sqlite], {'h': herb_name.lower()}
+            )
+            total_compounds = total_genes = 0
+            yield '{"compounds":['
+            for rows in result.partitions():
+                chunks = []
+                for compound, genes, gene_count in rows:
+                    # SQLite returns the array as JSON text, which is written out as is
+                    # (PostgreSQL returns it already decoded)
+                    genes_json = genes if isinstance(genes, str) else json_utils.dumps(genes)
+                    chunks.append(
+                        f'{{"compound":{json_utils.dumps(compound)},"gene_count":{gene_count},"genes":{genes_json}}}'
+                    )
+                    total_genes += gene_count
+                yield (',' if total_compounds else '') + ','.join(chunks)
+                total_compounds += len(chunks)
+            yield (
+                f'],"herb":{json_utils.dumps(herb_name)},'
+                f'"total_compounds":{total_compounds},"total_genes":{total_genes}}}\n'
+            )
+        finally:
+            conn.close()
+    
+    return Response(generate(), mimetype='application/json')
 
 
 @main_bp.route('/api/diseases')
@@ -279,20 +446,27 @@ def get_disease_suggestions():
     if len(query) < 1:
         return jsonify([])
     
-    session = Session()
+    conn = engine.connect()
     try:
         # Get more results than needed for better sorting
-        matching_diseases = session.query(Disease.diseaseName).filter(
-            Disease.diseaseName.ilike(f'%{query}%')
-        ).distinct().limit(Config.MAX_SUGGESTIONS * 3).all()
-        
-        suggestions = [disease[0] for disease in matching_diseases]
+        if _disease_name_fts_ready:
+            # SQLite: the trigram index answers LIKE '%term%' (case-insensitive) without a table scan
+            suggestions = conn.execute(
+                text(f'SELECT DISTINCT "diseaseName" FROM {DISEASE_NAME_FTS} WHERE "diseaseName" LIKE :pattern LIMIT :limit'),
+                {'pattern': f'%{query}%', 'limit': Config.MAX_SUGGESTIONS * 3}
+            ).scalars().all()
+        else:
+            # PostgreSQL serves ILIKE from the pg_trgm index created at startup
+            suggestions = conn.execute(select(Disease.diseaseName).where(
+                Disease.diseaseName.ilike(f'%{query}%')
+            ).distinct().limit(Config.MAX_SUGGESTIONS * 3)).scalars().all()
         
-        # Sort by relevance
+        # Sort by relevance (each name is lowercased once, up front)
         query_lower = query.lower()
+        candidates = [(name, name.lower()) for name in suggestions]
         
-        def relevance_score(name):
-            name_lower = name.lower()
+        def relevance_score(candidate):
+            name, name_lower = candidate
             # Exact match (highest priority)
             if name_lower == query_lower:
                 return (0, len(name), name_lower)
@@ -308,12 +482,11 @@ def get_disease_suggestions():
                 pos = name_lower.find(query_lower)
                 return (3, pos, len(name), name_lower)
         
-        suggestions.sort(key=relevance_score)
-        
-        # Return only the configured max
-        return jsonify(suggestions[:Config.MAX_SUGGESTIONS])
+        # Only the configured max is returned, so partially sort with a heap
+        top = heapq.nsmallest(Config.MAX_SUGGESTIONS, candidates, key=relevance_score)
+        return jsonify([name for name, _ in top])
     finally:
-        session.close()
+        conn.close()
 
 
 @main_bp.route('/api/herbs')
@@ -328,49 +501,44 @@ def get_herb_suggestions():
     if len(query) < 1:
         return jsonify([])
     
-    session = Session()
-    try:
-        # Get all unique herb names from database
-        all_herbs = session.query(Herb.herbName).distinct().all()
-        all_herb_names = [h[0] for h in all_herbs]
+    # Get all unique herb names (cached)
+    all_herb_names, _ = get_all_herb_names()
+    
+    # Check if query is Korean (contains Hangul characters); a compiled regex, cached per query
+    is_korean_query, query_lower = classify_query(query)
+    
+    if is_korean_query:
+        # Search using bilingual function for Korean input
+        results = search_herbs_bilingual(query, all_herb_names)
+    else:
+        # English search with Korean names added
+        # Substring matches from the n-gram index, instead of scanning every name
+        matching_herbs = match_english_names(query_lower, all_herb_names)
         
-        # Check if query is Korean (contains Hangul characters)
-        is_korean_query = any('\uac00' <= char <= '\ud7a3' for char in query)
+        # Sort by relevance
+        def relevance_score(candidate):
+            name, name_lower = candidate
+            if name_lower == query_lower:
+                return (0, len(name), name_lower)
+            elif name_lower.startswith(query_lower):
+                return (1, len(name), name_lower)
+            elif any(word.startswith(query_lower) for word in name_lower.split()):
+                return (2, len(name), name_lower)
+            else:
+                pos = name_lower.find(query_lower)
+                return (3, pos, len(name), name_lower)
         
-        if is_korean_query:
-            # Search using bilingual function for Korean input
-            results = search_herbs_bilingual(query, all_herb_names)
-        else:
-            # English search with Korean names added
-            query_lower = query.lower()
-            matching_herbs = [h for h in all_herb_names if query_lower in h.lower()]
-            
-            # Sort by relevance
-            def relevance_score(name):
-                name_lower = name.lower()
-                if name_lower == query_lower:
-                    return (0, len(name), name_lower)
-                elif name_lower.startswith(query_lower):
-                    return (1, len(name), name_lower)
-                elif any(word.startswith(query_lower) for word in name_lower.split()):
-                    return (2, len(name), name_lower)
-                else:
-                    pos = name_lower.find(query_lower)
-                    return (3, pos, len(name), name_lower)
-            
-            matching_herbs.sort(key=relevance_score)
-            
-            # Add Korean names
-            results = []
-            for herb in matching_herbs[:Config.MAX_SUGGESTIONS]:
-                results.append({
-                    'english': herb,
-                    'korean': get_korean_name(herb)
-                })
-        
-        return jsonify(results[:Config.MAX_SUGGESTIONS])
-    finally:
-        session.close()
+        top_herbs = heapq.nsmallest(Config.MAX_SUGGESTIONS, matching_herbs, key=relevance_score)
+        
+        # Add Korean names
+        results = []
+        for herb, _ in top_herbs:
+            results.append({
+                'english': herb,
+                'korean': get_korean_name(herb)
+            })
+    
+    return jsonify(results[:Config.MAX_SUGGESTIONS])
 
 
 @main_bp.route('/api/herbs/validate')
@@ -381,11 +549,10 @@ def validate_herb():
     if not name:
         return jsonify({'valid': False, 'english': None, 'korean': None})
     
-    session = Session()
+    conn = engine.connect()
     try:
-        # Get all herb names for validation
-        all_herbs = session.query(Herb.herbName).distinct().all()
-        all_herb_names = [h[0] for h in all_herbs]
+        # Get all herb names for validation (cached)
+        all_herb_names, _ = get_all_herb_names()
         
         # Use bilingual validation
         result = validate_herb_bilingual(name, all_herb_names)
@@ -399,37 +566,80 @@ def validate_herb():
             })
         
         # Fallback: Try exact match in database (case-insensitive)
-        herb = session.query(Herb.herbName).filter(
+        herb = conn.execute(select(Herb.herbName).where(
             func.lower(Herb.herbName) == name.lower()
-        ).first()
+        ).limit(1)).scalar()
         
         if herb:
             return jsonify({
                 'valid': True, 
-                'name': herb[0],
-                'english': herb[0],
-                'korean': get_korean_name(herb[0])
+                'name': herb,
+                'english': herb,
+                'korean': get_korean_name(herb)
             })
         
         return jsonify({'valid': False, 'name': None, 'english': None, 'korean': None})
     finally:
-        session.close()
+        conn.close()
 
 
 @main_bp.route('/api/stats')
+@cache.cached()
 def get_stats():
     """API endpoint to get database statistics."""
-    session = Session()
+    conn = engine.connect()
     try:
-        disease_count = session.query(Disease.diseaseName).distinct().count()
-        herb_count = session.query(Herb.herbName).distinct().count()
+        # One summary row per distinct name
+        disease_count = conn.execute(select(func.count()).select_from(DiseaseSummary)).scalar()
+        herb_count = conn.execute(select(func.count()).select_from(HerbSummary)).scalar()
         
         return jsonify({
             'diseases': disease_count,
             'herbs': herb_count
         })
     finally:
-        session.close()
+        conn.close()
+
+
+def _is_complete_analysis(results: dict) -> bool:
+    """
+    Whether results can be reused for an identical submission.
+    Enrichr failures are only logged, leaving prescriptions without enrichment data;
+    those results are saved but not reused, so the next submission retries.
+    """
+    if any(error.startswith('Enrichment analysis error') for error in results.get('errors', [])):
+        return False
+    expected = sum(1 for p in results.get('prescriptions', []) if p.get('unique_gene_count'))
+    # analyze_prescriptions leaves enrichment_data as None when there was nothing to enrich
+    enrichment = results.get('enrichment_data') or []
+    return len(enrichment) == expected and all('enrichment_data' in item for item in enrichment)
+
+
+def _load_saved_analysis(input_hash: str):
+    """Return the latest complete saved results for these inputs, ready to render, or None."""
+    with engine.connect() as conn:
+        row = conn.execute(
+            select(AnalysisResult.id, AnalysisResult.results_json, AnalysisResult.ai_analysis_json)
+            .where(AnalysisResult.input_hash == input_hash)
+            .order_by(AnalysisResult.id.desc())
+            .limit(1)
+        ).first()
+    if row is None:
+        return None
+    
+    try:
+        results = json_utils.loads(row.results_json)
+    except ValueError:
+        return None
+    results['result_id'] = row.id
+    
+    # Include saved AI analysis if available (as on the saved result page)
+    if row.ai_analysis_json:
+        try:
+            results['saved_ai_analysis'] = json_utils.loads(row.ai_analysis_json)
+        except ValueError:
+            results['saved_ai_analysis'] = None
+    return results
 
 
 @main_bp.route('/analyze', methods=['POST'])
@@ -443,43 +653,62 @@ def analyze():
         if not disease_name:
             return render_template('index.html', error="Please enter a disease name")
         
+        # Bound the work a single request can ask for before parsing anything
+        if len(disease_name) > Config.MAX_DISEASE_NAME_CHARS or len(herbs_data_json) > Config.MAX_ANALYZE_INPUT_CHARS:
+            return render_template('index.html', error="Input is too large")
+        
         try:
-            herbs_data = json.loads(herbs_data_json)
-        except json.JSONDecodeError:
+            herbs_data = json_utils.loads(herbs_data_json)
+        except ValueError:
             return render_template('index.html', error="Invalid herbs data format")
         
         if not herbs_data:
             return render_template('index.html', error="Please add at least one prescription with herbs")
         
+        if not isinstance(herbs_data, list):
+            return render_template('index.html', error="Invalid herbs data format")
+        
+        if len(herbs_data) > Config.MAX_PRESCRIPTIONS:
+            return render_template('index.html', error=f"Please add at most {Config.MAX_PRESCRIPTIONS} prescriptions")
+        
         # Parse herb lists
         herb_lists = []
         for herbs_string in herbs_data:
-            herbs = [herb.strip() for herb in herbs_string.split(',') if herb.strip()]
+            herbs = [herb.strip() for herb in str(herbs_string).split(',') if herb.strip()]
+            if len(herbs) > Config.MAX_HERBS_PER_PRESCRIPTION:
+                return render_template('index.html', error=f"Please add at most {Config.MAX_HERBS_PER_PRESCRIPTION} herbs per prescription")
             if herbs:
                 herb_lists.append(herbs)
         
         if not herb_lists:
             return render_template('index.html', error="Please add at least one herb to a prescription")
         
+        # Identical submissions reuse the saved result instead of repeating the analysis
+        input_hash = hashlib.sha256(json_utils.dumps([disease_name, herb_lists]).encode('utf-8')).hexdigest()
+        saved = _load_saved_analysis(input_hash)
+        if saved is not None:
+            return render_template('result.html', results=saved)
+        
         # Perform analysis
         results = analyze_prescriptions(disease_name, herb_lists)
         
-        # Save to history
+        # Save to history (a single Core INSERT ... RETURNING; no ORM unit of work needed)
         try:
-            session = Session()
             common_genes_count = len(results.get('common_genes', []))
             
-            new_result = AnalysisResult(
-                disease_name=disease_name,
-                prescriptions=json.dumps(herb_lists),
-                results_json=json.dumps(results, default=str),
-                common_genes_count=common_genes_count,
-                created_at=datetime.now(KST)
-            )
-            session.add(new_result)
-            session.commit()
-            result_id = new_result.id
-            session.close()
+            with engine.begin() as conn:
+                result_id = conn.execute(
+                    insert(AnalysisResult).values(
+                        disease_name=disease_name,
+                        prescriptions=json_utils.dumps(herb_lists),
+                        results_json=json_utils.dumps(results),
+                        common_genes_count=common_genes_count,
+                        prescriptions_count=len(herb_lists),
+                        herbs_count=sum(len(herbs) for herbs in herb_lists),
+                        input_hash=input_hash if _is_complete_analysis(results) else None,
+                        created_at=datetime.now(KST)
+                    ).returning(AnalysisResult.id)
+                ).scalar_one()
             
             # Add ID to results for linking
             results['result_id'] = result_id
@@ -497,114 +726,176 @@ def get_results_history():
     page = request.args.get('page', 1, type=int)
     per_page = request.args.get('per_page', 10, type=int)
     
-    session = Session()
-    try:
-        query = session.query(AnalysisResult).order_by(desc(AnalysisResult.created_at))
-        
-        total = query.count()
-        
-        results = query.offset((page - 1) * per_page).limit(per_page).all()
-        
-        data = []
-        for r in results:
-            try:
-                prescriptions = json.loads(r.prescriptions)
-                herb_count = sum(len(p) for p in prescriptions)
-            except:
-                prescriptions = []
-                herb_count = 0
-            
-            data.append({
-                'id': r.id,
-                'disease_name': r.disease_name,
-                'prescriptions_count': len(prescriptions),
-                'herbs_count': herb_count,
-                'common_genes_count': r.common_genes_count,
-                'created_at': r.created_at.strftime('%Y-%m-%d %H:%M') if r.created_at else 'Unknown'
-            })
-        
-        return jsonify({
-            'data': data,
-            'total': total,
-            'page': page,
-            'per_page': per_page,
-            'total_pages': (total + per_page - 1) // per_page
+    session = db_session()
+    # Only the list columns; the (large) results and AI JSON are never loaded here
+    query = session.query(
+        AnalysisResult.id,
+        AnalysisResult.disease_name,
+        AnalysisResult.prescriptions_count,
+        AnalysisResult.herbs_count,
+        AnalysisResult.common_genes_count,
+        AnalysisResult.created_at
+    ).order_by(desc(AnalysisResult.created_at))
+    
+    results, total = _page_with_total(query, page, per_page)
+    
+    data = []
+    for r in results:
+        # Counts are stored at save time, so the prescriptions JSON isn't decoded here
+        data.append({
+            'id': r.id,
+            'disease_name': r.disease_name,
+            'prescriptions_count': r.prescriptions_count or 0,
+            'herbs_count': r.herbs_count or 0,
+            'common_genes_count': r.common_genes_count,
+            'created_at': r.created_at.strftime('%Y-%m-%d %H:%M') if r.created_at else 'Unknown'
         })
-    finally:
-        session.close()
+    
+    return jsonify({
+        'data': data,
+        'total': total,
+        'page': page,
+        'per_page': per_page,
+        'total_pages': (total + per_page - 1) // per_page
+    })
 
 
 @main_bp.route('/api/results/<int:result_id>')
 def get_result_detail(result_id):
     """API endpoint to get a specific analysis result."""
-    session = Session()
+    session = db_session()
+    result = session.query(AnalysisResult).options(load_only(
+        AnalysisResult.id,
+        AnalysisResult.disease_name,
+        AnalysisResult.prescriptions,
+        AnalysisResult.results_json,
+        AnalysisResult.created_at
+    )).filter(AnalysisResult.id == result_id).first()
+    
+    if not result:
+        return jsonify({'error': 'Result not found'}), 404
+    
     try:
-        result = session.query(AnalysisResult).filter(AnalysisResult.id == result_id).first()
-        
-        if not result:
-            return jsonify({'error': 'Result not found'}), 404
-        
-        try:
-            results_data = json.loads(result.results_json)
-        except:
-            results_data = {}
-        
-        return jsonify({
-            'id': result.id,
-            'disease_name': result.disease_name,
-            'prescriptions': json.loads(result.prescriptions),
-            'results': results_data,
-            'created_at': result.created_at.strftime('%Y-%m-%d %H:%M:%S') if result.created_at else 'Unknown'
-        })
-    finally:
-        session.close()
+        results_data = json_utils.loads(result.results_json)
+    except:
+        results_data = {}
+    
+    return jsonify({
+        'id': result.id,
+        'disease_name': result.disease_name,
+        'prescriptions': json_utils.loads(result.prescriptions),
+        'results': results_data,
+        'created_at': result.created_at.strftime('%Y-%m-%d %H:%M:%S') if result.created_at else 'Unknown'
+    })
 
 
 @main_bp.route('/results/<int:result_id>')
 @login_required
 def view_result(result_id):
     """View a specific saved result (login required)."""
-    db_session = Session()
+    session = db_session()
+    result = session.query(AnalysisResult).options(load_only(
+        AnalysisResult.id,
+        AnalysisResult.results_json,
+        AnalysisResult.ai_analysis_json
+    )).filter(AnalysisResult.id == result_id).first()
+    
+    if not result:
+        return redirect(url_for('main.results'))
+    
     try:
-        result = db_session.query(AnalysisResult).filter(AnalysisResult.id == result_id).first()
-        
-        if not result:
-            return redirect(url_for('main.results'))
-        
+        results_data = json_utils.loads(result.results_json)
+        results_data['result_id'] = result.id
+    except:
+        results_data = {}
+    
+    # Include saved AI analysis if available
+    if result.ai_analysis_json:
         try:
-            results_data = json.loads(result.results_json)
-            results_data['result_id'] = result.id
+            results_data['saved_ai_analysis'] = json_utils.loads(result.ai_analysis_json)
         except:
-            results_data = {}
-        
-        # Include saved AI analysis if available
-        if result.ai_analysis_json:
-            try:
-                results_data['saved_ai_analysis'] = json.loads(result.ai_analysis_json)
-            except:
-                results_data['saved_ai_analysis'] = None
-        
-        return render_template('result.html', results=results_data)
-    finally:
-        db_session.close()
+            results_data['saved_ai_analysis'] = None
+    
+    return render_template('result.html', results=results_data)
 
 
 @main_bp.route('/api/results/<int:result_id>', methods=['DELETE'])
 def delete_result(result_id):
     """Delete a specific analysis result."""
-    session = Session()
+    session = db_session()
+    result = session.query(AnalysisResult).options(load_only(AnalysisResult.id))\
+        .filter(AnalysisResult.id == result_id).first()
+    
+    if not result:
+        return jsonify({'error': 'Result not found'}), 404
+    
+    session.delete(result)
+    session.commit()
+    
+    return jsonify({'success': True})
+
+
+# Background thread for database writes that the response doesn't depend on
+_db_writer = ThreadPoolExecutor(max_workers=2, thread_name_prefix='db-writer')
+
+
+# C0 and C1 control characters, deleted by str.translate
+_CONTROL_CHARS = dict.fromkeys([*range(0x20), *range(0x7f, 0xa0)])
+
+
+def _empty_like(container):
+    """Return an empty dict, or a list of the same length to be filled in by index."""
+    return {} if isinstance(container, dict) else [None] * len(container)
+
+
+def _clean_for_json(obj):
+    """Remove control characters from the strings in obj (nested dicts/lists are walked with a stack)."""
+    if isinstance(obj, str):
+        return obj.translate(_CONTROL_CHARS)
+    if not isinstance(obj, (dict, list)):
+        return obj
+    
+    cleaned = _empty_like(obj)
+    stack = [(obj, cleaned)]
+    while stack:
+        source, target = stack.pop()
+        for key, value in (source.items() if isinstance(source, dict) else enumerate(source)):
+            if isinstance(value, str):
+                value = value.translate(_CONTROL_CHARS)
+            elif isinstance(value, (dict, list)):
+                copy = _empty_like(value)
+                stack.append((value, copy))
+                value = copy
+            target[key] = value
+    return cleaned
+
+
+def _save_ai_analysis(result_id, ai_results):
+    """Store an AI analysis on a saved result (runs on the background writer)."""
     try:
-        result = session.query(AnalysisResult).filter(AnalysisResult.id == result_id).first()
-        
-        if not result:
-            return jsonify({'error': 'Result not found'}), 404
-        
-        session.delete(result)
-        session.commit()
-        
-        return jsonify({'success': True})
+        session = db_session()
+        # Only the AI column is written, so don't load the stored results
+        result = session.query(AnalysisResult).options(load_only(AnalysisResult.id))\
+            .filter(AnalysisResult.id == result_id).first()
+        if result:
+            # Ensure AI analysis can be serialized to JSON
+            try:
+                ai_json_str = json_utils.dumps(ai_results)
+                result.ai_analysis_json = ai_json_str
+                session.commit()
+                print(f"[DB] Saved AI analysis for result {result_id}")
+            except (TypeError, ValueError) as json_err:
+                print(f"[DB] JSON serialization error: {json_err}")
+                # Try with more aggressive cleaning
+                cleaned_results = _clean_for_json(ai_results)
+                result.ai_analysis_json = json_utils.dumps(cleaned_results)
+                session.commit()
+                print(f"[DB] Saved cleaned AI analysis for result {result_id}")
+    except Exception as e:
+        print(f"[DB] Error saving AI analysis: {e}")
     finally:
-        session.close()
+        # Writer threads outlive requests, so the teardown hook doesn't clean up here
+        db_session.remove()
 
 
 @main_bp.route('/api/ai-analysis', methods=['POST'])
@@ -645,38 +936,10 @@ def ai_analysis():
         # Generate full AI analysis (summary_table, detailed_analysis, clinical_questions)
         ai_results = generate_full_ai_analysis(disease_name, analysis_results)
         
-        # Save AI analysis to database if result_id provided and analysis succeeded
+        # Save AI analysis to database if result_id provided and analysis succeeded.
+        # The write happens in the background so the response isn't held up by the commit.
         if result_id and ai_results.get('has_ai_analysis'):
-            try:
-                session = Session()
-                result = session.query(AnalysisResult).filter(AnalysisResult.id == result_id).first()
-                if result:
-                    # Ensure AI analysis can be serialized to JSON
-                    try:
-                        ai_json_str = json.dumps(ai_results, default=str, ensure_ascii=False)
-                        result.ai_analysis_json = ai_json_str
-                        session.commit()
-                        print(f"[DB] Saved AI analysis for result {result_id}")
-                    except (TypeError, ValueError) as json_err:
-                        print(f"[DB] JSON serialization error: {json_err}")
-                        # Try with more aggressive cleaning
-                        import re
-                        def clean_for_json(obj):
-                            if isinstance(obj, str):
-                                # Remove control characters
-                                return re.sub(r'[\x00-\x1f\x7f-\x9f]', '', obj)
-                            elif isinstance(obj, dict):
-                                return {k: clean_for_json(v) for k, v in obj.items()}
-                            elif isinstance(obj, list):
-                                return [clean_for_json(i) for i in obj]
-                            return obj
-                        cleaned_results = clean_for_json(ai_results)
-                        result.ai_analysis_json = json.dumps(cleaned_results, default=str)
-                        session.commit()
-                        print(f"[DB] Saved cleaned AI analysis for result {result_id}")
-                session.close()
-            except Exception as e:
-                print(f"[DB] Error saving AI analysis: {e}")
+            _db_writer.submit(_save_ai_analysis, result_id, ai_results)
         
         return jsonify(ai_results)
         
@@ -693,10 +956,7 @@ def ai_analysis():
 @main_bp.route('/api/ai-analysis/status')
 def ai_analysis_status():
     """Check if AI analysis is available (API key configured)."""
-    import os
-    from dotenv import load_dotenv
-    load_dotenv(override=True)
-    api_key = os.environ.get('GEMINI_API_KEY') or Config.GEMINI_API_KEY
+    api_key = get_api_key()
     return jsonify({
         'available': bool(api_key),
         'message': 'AI analysis is available' if api_key else 'GEMINI_API_KEY not configured'
@@ -2,85 +2,207 @@
 Core services for gene analysis - OPTIMIZED VERSION.
 Contains the main business logic for disease-herb gene analysis.
 """
-import json
+import hashlib
+import time
+from collections import Counter
+from itertools import islice
 import requests
-import pandas as pd
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+import numpy as np
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from sqlalchemy import func, create_engine, text
-from sqlalchemy.orm import sessionmaker
-from models import Disease, Herb
+from functools import lru_cache
+from sqlalchemy import case, func, insert, select, text
+from models import Disease, Herb, DiseaseSummary, HerbSummary
 from config import Config
+from extensions import cache, db_session, engine
+import json_utils
+
+
+# Shared HTTP session so Enrichr uploads and enrichment fetches reuse pooled TLS connections.
+# Rate limits and server errors are retried with exponential backoff (honouring Retry-After),
+# uploads included - a repeated addList only creates an unused list. Once retries run out
+# the last response is returned, and the helpers below report it as a failure.
+_ENRICHR_SESSION = requests.Session()
+_ENRICHR_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=8,
+    pool_maxsize=8,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=['GET', 'POST'],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+))
 
+# Shared worker threads for the Enrichr calls, sized to the connection pool above; started
+# once instead of per analysis, with calls beyond the pool size queueing for a free worker
+_ENRICHR_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix='enrichr')
 
-# Create engine with optimized settings
-# Only use check_same_thread for SQLite (not valid for PostgreSQL)
-engine_args = {
-    'pool_pre_ping': True,
-    'pool_recycle': 300,
-}
-if Config.SQLALCHEMY_DATABASE_URI.startswith('sqlite'):
-    engine_args['connect_args'] = {'check_same_thread': False}
 
-engine = create_engine(Config.SQLALCHEMY_DATABASE_URI, **engine_args)
-Session = sessionmaker(bind=engine)
+@lru_cache(maxsize=512)
+def _disease_genes_cached(disease_name_lower):
+    """Gene symbols for a lowercased disease name, as a tuple (cached; the table is read-only)."""
+    # Request-scoped session, removed by the teardown hook in routes
+    session = db_session()
+    # lower(diseaseName) is an indexed expression (ix_disease_lower_name_gene), so this is a B-tree lookup
+    return tuple(session.execute(
+        select(Disease.geneName).where(func.lower(Disease.diseaseName) == disease_name_lower)
+    ).scalars())
 
 
 def search_disease_genes(disease_name):
     """
     Search for genes associated with a disease.
-    OPTIMIZED: Uses indexed query.
+    OPTIMIZED: Uses indexed query, cached per disease name.
     """
-    session = Session()
-    try:
-        # Use LOWER() which is now indexed
-        matching_records = session.query(Disease.geneName).filter(
-            func.lower(Disease.diseaseName) == disease_name.lower()
-        ).all()
-        disease_gene_symbols = [record[0] for record in matching_records]
-        return disease_gene_symbols
-    finally:
-        session.close()
+    return list(_disease_genes_cached(disease_name.lower()))
+
+
+def refresh_disease_gene_cache():
+    """Drop the cached disease genes (call after changing the diseases table)."""
+    _disease_genes_cached.cache_clear()
+
+
+def rebuild_summary_tables(conn):
+    """Recompute the summary tables from diseases and herbs, on the caller's connection."""
+    conn.execute(DiseaseSummary.__table__.delete())
+    conn.execute(insert(DiseaseSummary).from_select(
+        ['diseaseName', 'gene_count'],
+        select(Disease.diseaseName, func.count(Disease.geneName))
+        .where(Disease.diseaseName.isnot(None))
+        .group_by(Disease.diseaseName)
+    ))
+    conn.execute(HerbSummary.__table__.delete())
+    conn.execute(insert(HerbSummary).from_select(
+        ['herbName', 'gene_count', 'compound_count'],
+        select(Herb.herbName, func.count(Herb.Genes), func.count(func.distinct(Herb.Compound)))
+        .where(Herb.herbName.isnot(None))
+        .group_by(Herb.herbName)
+    ))
+
+
+def refresh_summary_tables():
+    """Recompute the summary tables (call after changing the diseases or herbs tables)."""
+    with engine.begin() as conn:
+        rebuild_summary_tables(conn)
+
+
+# Distinct herb names for suggestions/validation, reloaded at most every HERB_CACHE_TTL seconds
+HERB_CACHE_TTL = 300
+_HERB_CACHE = {'names': None, 'lower': None, 'ts': 0}
+
+
+def get_all_herb_names() -> tuple:
+    """Return (names, lowercased names) for every distinct herb, from the in-process cache."""
+    if _HERB_CACHE['names'] is None or time.time() - _HERB_CACHE['ts'] > HERB_CACHE_TTL:
+        # Plain Core query: a single string column needs no ORM row processing
+        with engine.connect() as conn:
+            names = tuple(conn.execute(text('SELECT DISTINCT "herbName" FROM herbs')).scalars().all())
+        _HERB_CACHE.update(names=names, lower=tuple(n.lower() for n in names), ts=time.time())
+    return _HERB_CACHE['names'], _HERB_CACHE['lower']
 
 
-def search_herb_genes_batch(herb_names):
+def refresh_herb_cache():
+    """Drop the cached herb names (call after changing the herbs table)."""
+    _HERB_CACHE.update(names=None, lower=None, ts=0)
+
+
+# Rows per executemany batch when loading source data
+BULK_LOAD_CHUNK_SIZE = 5000
+
+
+def _bulk_load(model, records) -> int:
     """
-    Search for genes targeted by a list of herbs.
-    OPTIMIZED: Single batch query instead of multiple queries.
+    Insert records (dicts keyed by column name) into model's table in one transaction.
+    Core executemany in fixed-size chunks, so an iterator is never fully materialized and
+    no ORM objects are built; the summary tables are rebuilt in the same transaction.
+    The disease gene, herb name and response caches are then cleared, but only in this
+    process: other gunicorn workers keep serving their stale caches until they restart.
+    Returns the number of rows inserted.
     """
-    if not herb_names:
-        return [], []
+    records = iter(records)
+    inserted = 0
+    with engine.begin() as conn:
+        while True:
+            chunk = list(islice(records, BULK_LOAD_CHUNK_SIZE))
+            if not chunk:
+                break
+            conn.execute(insert(model), chunk)
+            inserted += len(chunk)
+        rebuild_summary_tables(conn)
     
-    session = Session()
-    try:
-        # Normalize herb names to lowercase for comparison
-        herb_names_lower = [h.lower() for h in herb_names]
-        herb_names_map = {h.lower(): h for h in herb_names}  # Map to original case
-        
-        # Single batch query for all herbs - MUCH faster!
-        herb_records = session.query(Herb.herbName, Herb.Genes).filter(
-            func.lower(Herb.herbName).in_(herb_names_lower)
-        ).all()
-        
-        # Group genes by herb
-        found_herbs = set()
-        gene_symbols = []
-        
-        for herbName, gene in herb_records:
-            found_herbs.add(herbName.lower())
-            gene_symbols.append(gene)
-        
-        # Find missing herbs
-        missing_herbs = [herb_names_map[h] for h in herb_names_lower if h not in found_herbs]
-        
-        return gene_symbols, missing_herbs
-    finally:
-        session.close()
+    # Drop everything derived from the old rows (this process only)
+    refresh_disease_gene_cache()
+    refresh_herb_cache()
+    cache.clear()
+    return inserted
 
 
-# Keep original function for compatibility but use optimized version
-def search_herb_genes(herb_names):
-    """Alias for batch function."""
-    return search_herb_genes_batch(herb_names)
+def bulk_load_diseases(records) -> int:
+    """
+    Append disease-gene rows (e.g. {'diseaseName': ..., 'geneName': ...}) to the diseases table.
+    Caches are only cleared in the calling process; restart the other workers afterwards.
+    """
+    return _bulk_load(Disease, records)
+
+
+def bulk_load_herbs(records) -> int:
+    """
+    Append herb-gene rows (e.g. {'herbName': ..., 'Compound': ..., 'Genes': ...}) to the herbs table.
+    Caches are only cleared in the calling process; restart the other workers afterwards.
+    """
+    return _bulk_load(Herb, records)
+
+
+def search_common_genes_for_prescriptions(disease_name, herb_lists):
+    """
+    Find each prescription's herb gene count, the genes it shares with the disease and its missing herbs.
+    OPTIMIZED: The intersection runs in the database, so only shared genes are transferred.
+    Returns a (gene_count, common_genes, missing_herbs) triple per prescription.
+    """
+    all_herbs_lower = {h.lower() for herb_names in herb_lists for h in herb_names}
+    if not all_herbs_lower:
+        return [(0, set(), []) for _ in herb_lists]
+    
+    # Request-scoped session, removed by the teardown hook in routes
+    session = db_session()
+    # One grouped query over herbs: rows whose gene is also a disease gene are grouped per
+    # (herb, gene), every other row falls into a single (herb, NULL) group. Summing the
+    # counts gives each herb's gene rows, and only the shared genes are transferred.
+    disease_genes = (
+        select(Disease.geneName)
+        .where(func.lower(Disease.diseaseName) == disease_name.lower())
+        .cte('disease_genes')
+    )
+    herb_name_lower = func.lower(Herb.herbName)
+    shared_gene = case((Herb.Genes.in_(select(disease_genes.c.geneName)), Herb.Genes))
+    gene_counts = {}
+    common_by_herb = {}
+    for herb_lower, gene, row_count in session.execute(
+        select(herb_name_lower, shared_gene, func.count())
+        .where(herb_name_lower.in_(all_herbs_lower))
+        .group_by(herb_name_lower, shared_gene)
+    ):
+        gene_counts[herb_lower] = gene_counts.get(herb_lower, 0) + row_count
+        common = common_by_herb.setdefault(herb_lower, set())
+        if gene is not None:
+            common.add(gene)
+    
+    results = []
+    for herb_names in herb_lists:
+        herb_names_lower = [h.lower() for h in herb_names]
+        # Map to original case; its keys are the distinct herbs in first-seen order
+        herb_names_map = dict(zip(herb_names_lower, herb_names))
+        # Each herb counted once, even if the prescription names it twice
+        gene_count = sum(gene_counts.get(h, 0) for h in herb_names_map)
+        common_genes = set().union(*(common_by_herb.get(h, ()) for h in herb_names_map))
+        missing_herbs = [herb_names_map[h] for h in herb_names_lower if h not in gene_counts]
+        results.append((gene_count, common_genes, missing_herbs))
+    
+    return results
 
 
 def find_common_genes(disease_genes, herb_genes_list):
@@ -89,45 +211,37 @@ def find_common_genes(disease_genes, herb_genes_list):
     OPTIMIZED: Uses set operations.
     """
     disease_genes_set = set(disease_genes)
-    all_common_genes = []
-
-    for herb_genes in herb_genes_list:
-        herb_genes_set = set(herb_genes)
-        common_genes = disease_genes_set & herb_genes_set
-        all_common_genes.append(list(common_genes))
-
-    return all_common_genes
+    # intersection() walks the herb genes without building a set of them first
+    return [list(disease_genes_set.intersection(herb_genes)) for herb_genes in herb_genes_list]
 
 
 def find_unique_genes(all_common_genes):
     """
     Find genes unique to each prescription.
+    OPTIMIZED: Counts each gene's prescriptions in one pass instead of
+    building the union of all other prescriptions for every prescription.
     """
-    all_unique_genes = []
-
-    for i, genes in enumerate(all_common_genes):
-        if len(all_common_genes) > 1:
-            other_genes = set().union(*all_common_genes[:i], *all_common_genes[i + 1:])
-            unique_genes = set(genes) - other_genes
-        else:
-            unique_genes = set(genes)
-        
-        all_unique_genes.append(unique_genes)
-
-    return all_unique_genes
+    gene_sets = [set(genes) for genes in all_common_genes]
+    if len(gene_sets) < 2:
+        # A lone prescription's genes are all unique; nothing to count
+        return gene_sets
+    prescription_counts = Counter(gene for genes in gene_sets for gene in genes)
+    return [{gene for gene in genes if prescription_counts[gene] == 1} for genes in gene_sets]
 
 
 def upload_single_gene_list(gene_list, index):
     """Upload a single gene list to Enrichr (for parallel execution)."""
     upload_url = f'{Config.ENRICHR_BASE_URL}/addList'
-    genes_str = "\n".join(list(gene_list))
+    # Enrichr's addList takes multipart form data; a field-only part (no filename) is the
+    # smallest body it accepts, since url-encoding would turn every newline into %0A
+    genes_str = "\n".join(gene_list)
     payload = {'list': (None, genes_str)}
     
-    response = requests.post(upload_url, files=payload, timeout=30)
+    response = _ENRICHR_SESSION.post(upload_url, files=payload, timeout=30)
     if not response.ok:
         raise Exception(f'Error uploading gene list {index} to Enrichr')
     
-    data = json.loads(response.text)
+    data = json_utils.loads(response.content)
     data['index'] = index
     return data
 
@@ -135,22 +249,21 @@ def upload_single_gene_list(gene_list, index):
 def upload_gene_lists_to_enrichr_parallel(gene_lists):
     """
     Upload gene lists to Enrichr API.
-    OPTIMIZED: Parallel uploads using ThreadPoolExecutor.
+    OPTIMIZED: Parallel uploads on the shared Enrichr worker threads.
     """
     all_data = [None] * len(gene_lists)
     
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        futures = {
-            executor.submit(upload_single_gene_list, gene_list, i): i 
-            for i, gene_list in enumerate(gene_lists)
-        }
-        
-        for future in as_completed(futures):
-            try:
-                data = future.result()
-                all_data[data['index']] = data
-            except Exception as e:
-                print(f"Error uploading gene list: {e}")
+    futures = {
+        _ENRICHR_EXECUTOR.submit(upload_single_gene_list, gene_list, i): i 
+        for i, gene_list in enumerate(gene_lists)
+    }
+    
+    for future in as_completed(futures):
+        try:
+            data = future.result()
+            all_data[data['index']] = data
+        except Exception as e:
+            print(f"Error uploading gene list: {e}")
     
     return [d for d in all_data if d is not None]
 
@@ -158,7 +271,7 @@ def upload_gene_lists_to_enrichr_parallel(gene_lists):
 def fetch_enrichment_single(user_list_id, library, index):
     """Fetch enrichment for a single gene list (for parallel execution)."""
     enrich_url = f'{Config.ENRICHR_BASE_URL}/enrich'
-    response = requests.get(
+    response = _ENRICHR_SESSION.get(
         f'{enrich_url}?userListId={user_list_id}&backgroundType={library}',
         timeout=60
     )
@@ -166,7 +279,7 @@ def fetch_enrichment_single(user_list_id, library, index):
     if not response.ok:
         raise Exception(f"Error fetching enrichment for userListId: {user_list_id}")
     
-    return index, json.loads(response.text)
+    return index, json_utils.loads(response.content)
 
 
 def perform_enrichment_analysis_parallel(data_list, library=None):
@@ -178,55 +291,113 @@ def perform_enrichment_analysis_parallel(data_list, library=None):
         library = Config.DEFAULT_GENE_LIBRARY
 
     # Parallel fetch enrichment results
-    with ThreadPoolExecutor(max_workers=3) as executor:
-        futures = {
-            executor.submit(fetch_enrichment_single, data['userListId'], library, i): i
-            for i, data in enumerate(data_list)
-        }
-        
-        for future in as_completed(futures):
-            try:
-                index, enrichment_data = future.result()
-                process_enrichment_data(data_list[index], enrichment_data)
-            except Exception as e:
-                print(f"Error fetching enrichment: {e}")
+    futures = {
+        _ENRICHR_EXECUTOR.submit(fetch_enrichment_single, data['userListId'], library, i): i
+        for i, data in enumerate(data_list)
+    }
+    
+    for future in as_completed(futures):
+        try:
+            index, enrichment_data = future.result()
+            process_enrichment_data(data_list[index], enrichment_data)
+        except Exception as e:
+            print(f"Error fetching enrichment: {e}")
 
     return data_list
 
 
+def _enrichment_row(element):
+    """Format one Enrichr term [rank, term, p, z, combined, genes, adj_p, old_p, old_adj_p]."""
+    (rank, term_name, p_value, z_score, combined_score, genes,
+     adjusted_p_value, old_p_value, old_adjusted_p_value) = element[:9]
+    return {
+        'Rank': rank,
+        'Term name': term_name,
+        'P-value': p_value,
+        'Z-score': z_score,
+        'Combined score': combined_score,
+        'Overlapping genes': ', '.join(genes),
+        'Adjusted p-value': adjusted_p_value,
+        'Old p-value': old_p_value,
+        'Old adjusted p-value': old_adjusted_p_value
+    }
+
+
 def process_enrichment_data(data, enrichment_data):
     """Process raw enrichment data into structured format."""
-    df = pd.DataFrame(enrichment_data)
-    data['enrichment_data'] = []
-
-    for _, row in df.iterrows():
-        for element in row:
-            rank = element[0]
-            term_name = element[1]
-            p_value = element[2]
-            z_score = element[3]
-            combined_score = element[4]
-            overlapping_genes = ', '.join(element[5])
-            adjusted_p_value = element[6]
-            old_p_value = element[7]
-            old_adjusted_p_value = element[8]
-
-            if adjusted_p_value < Config.ADJUSTED_PVALUE_THRESHOLD:
-                new_row = {
-                    'Rank': rank,
-                    'Term name': term_name,
-                    'P-value': p_value,
-                    'Z-score': z_score,
-                    'Combined score': combined_score,
-                    'Overlapping genes': overlapping_genes,
-                    'Adjusted p-value': adjusted_p_value,
-                    'Old p-value': old_p_value,
-                    'Old adjusted p-value': old_adjusted_p_value
-                }
-                data['enrichment_data'].append(new_row)
-
-    # Keep only top results
-    data['enrichment_data'] = data['enrichment_data'][:Config.MAX_ENRICHMENT_RESULTS]
+    # Enrichr returns {library: [term, ...]}; the term lists are walked directly
+    terms = [element for library_terms in enrichment_data.values() for element in library_terms]
+
+    # Significance filter as one vectorized comparison over the adjusted p-values. Terms
+    # arrive ranked, so the top results are the first survivors: the indices are cut to
+    # the limit before any result dict is built.
+    adjusted_p_values = np.fromiter((element[6] for element in terms), dtype=np.float64, count=len(terms))
+    top = np.flatnonzero(adjusted_p_values < Config.ADJUSTED_PVALUE_THRESHOLD)[:Config.MAX_ENRICHMENT_RESULTS]
+    data['enrichment_data'] = [_enrichment_row(terms[i]) for i in top]
+
+
+def _upload_and_enrich(gene_list, index, library):
+    """Upload one gene list, then fetch and process its enrichment (one pipeline task)."""
+    data = upload_single_gene_list(gene_list, index)
+    try:
+        _, enrichment_data = fetch_enrichment_single(data['userListId'], library, index)
+        process_enrichment_data(data, enrichment_data)
+    except Exception as e:
+        print(f"Error fetching enrichment: {e}")
+    return data
+
+
+def _enrichment_cache_key(gene_list, library):
+    """Cache key for a gene set's Enrichr results (independent of gene order)."""
+    digest = hashlib.sha1('\n'.join(sorted(gene_list)).encode('utf-8')).hexdigest()
+    return f'enrichr:{library}:{digest}'
+
+
+def enrich_gene_lists_parallel(gene_lists, library=None):
+    """
+    Upload gene lists to Enrichr and fetch their enrichment.
+    OPTIMIZED: Gene sets seen recently are served from the cache, and each list's
+    enrichment is fetched as soon as its own upload finishes, instead of waiting
+    for every upload to complete first.
+    """
+    if library is None:
+        library = Config.DEFAULT_GENE_LIBRARY
+
+    all_data = [None] * len(gene_lists)
+    cache_keys = [_enrichment_cache_key(gene_list, library) for gene_list in gene_lists]
+
+    # Cache misses grouped by gene set: identical lists are uploaded once and share the result
+    pending = {}
+    for i, key in enumerate(cache_keys):
+        cached = cache.get(key)
+        if cached is not None:
+            all_data[i] = {**cached, 'index': i}
+        else:
+            pending.setdefault(key, []).append(i)
+
+    if pending:
+        futures = [
+            _ENRICHR_EXECUTOR.submit(_upload_and_enrich, gene_lists[indices[0]], indices[0], library)
+            for indices in pending.values()
+        ]
+
+        for future in as_completed(futures):
+            try:
+                data = future.result()
+                key = cache_keys[data['index']]
+                for i in pending[key]:
+                    all_data[i] = {**data, 'index': i}
+                # Only complete results are cached, so a failed fetch is retried next time
+                if 'enrichment_data' in data:
+                    cache.set(
+                        key,
+                        {k: v for k, v in data.items() if k != 'index'},
+                        timeout=Config.ENRICHR_CACHE_TTL
+                    )
+            except Exception as e:
+                print(f"Error uploading gene list: {e}")
+
+    return [d for d in all_data if d is not None]
 
 
 # Backwards compatibility aliases
@@ -253,38 +424,33 @@ def analyze_prescriptions(disease_name, herb_lists):
         results['errors'].append(f"No genes found for disease: {disease_name}")
         return results
     
-    # Get herb genes for each prescription (batch queries - fast!)
-    all_herb_genes = []
-    for i, herb_names in enumerate(herb_lists):
-        herb_genes, missing_herbs = search_herb_genes_batch(herb_names)
-        
-        prescription_info = {
+    # One pass over the prescriptions: herb gene counts, missing herbs and the genes
+    # shared with the disease (intersected in the database - only shared genes come back)
+    prescriptions = results['prescriptions']
+    common_genes = []
+    prescription_genes = search_common_genes_for_prescriptions(disease_name, herb_lists)
+    for i, (herb_names, (gene_count, common, missing_herbs)) in enumerate(zip(herb_lists, prescription_genes)):
+        common_genes.append(common)
+        prescriptions.append({
             'index': i + 1,
             'herbs': herb_names,
-            'gene_count': len(herb_genes),
-            'missing_herbs': missing_herbs
-        }
-        results['prescriptions'].append(prescription_info)
-        all_herb_genes.append(herb_genes)
+            'gene_count': gene_count,
+            'missing_herbs': missing_herbs,
+            'common_gene_count': len(common)
+        })
         
         if missing_herbs:
             results['errors'].append(f"Prescription {i+1}: Herbs not found - {', '.join(missing_herbs)}")
     
-    # Find common genes (set operations - very fast!)
-    common_genes = find_common_genes(disease_genes, all_herb_genes)
-    
-    for i, genes in enumerate(common_genes):
-        results['prescriptions'][i]['common_gene_count'] = len(genes)
-    
     if not any(common_genes):
         results['errors'].append("No common genes found between disease and any prescription")
         return results
     
-    # Find unique genes
+    # Find unique genes (needs every prescription's common genes, so it follows the pass above)
     unique_genes = find_unique_genes(common_genes)
     
-    for i, genes in enumerate(unique_genes):
-        results['prescriptions'][i]['unique_gene_count'] = len(genes)
+    for prescription, genes in zip(prescriptions, unique_genes):
+        prescription['unique_gene_count'] = len(genes)
     
     # Perform enrichment analysis (parallel API calls - faster!)
     if any(len(genes) > 0 for genes in unique_genes):
@@ -293,13 +459,12 @@ def analyze_prescriptions(disease_name, herb_lists):
             non_empty_indices = [i for i, genes in enumerate(unique_genes) if len(genes) > 0]
             non_empty_genes = [unique_genes[i] for i in non_empty_indices]
             
-            upload_data = upload_gene_lists_to_enrichr_parallel(non_empty_genes)
-            enrichment_results = perform_enrichment_analysis_parallel(upload_data)
+            enrichment_results = enrich_gene_lists_parallel(non_empty_genes)
             
-            # Tag each enrichment result with its original prescription index (1-based)
-            for j, enrich_item in enumerate(enrichment_results):
-                if j < len(non_empty_indices):
-                    enrich_item['prescription_index'] = non_empty_indices[j] + 1  # 1-based
+            # Tag each enrichment result with its original prescription index (1-based);
+            # 'index' is the list's position in non_empty_genes, so failed uploads don't shift it
+            for enrich_item in enrichment_results:
+                enrich_item['prescription_index'] = non_empty_indices[enrich_item['index']] + 1
             
             results['enrichment_data'] = enrichment_results
         except Exception as e:
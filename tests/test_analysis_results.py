@@ -0,0 +1,39 @@
+"""
+Tests for saving analysis results that have no enrichment data.
+"""
+import unittest
+from unittest import mock
+
+import services
+from routes import _is_complete_analysis
+
+
+class IsCompleteAnalysisTest(unittest.TestCase):
+    """analyze_prescriptions leaves enrichment_data as None when there is nothing to enrich."""
+
+    def test_no_disease_genes(self):
+        with mock.patch.object(services, 'search_disease_genes', return_value=[]):
+            results = services.analyze_prescriptions('Unknown disease', [['huang qi']])
+        self.assertIsNone(results['enrichment_data'])
+        self.assertTrue(_is_complete_analysis(results))
+
+    def test_no_common_genes(self):
+        with mock.patch.object(services, 'search_disease_genes', return_value=['TP53']), \
+                mock.patch.object(services, 'search_common_genes_for_prescriptions',
+                                  return_value=[(12, set(), [])]):
+            results = services.analyze_prescriptions('Asthma', [['huang qi']])
+        self.assertIsNone(results['enrichment_data'])
+        self.assertEqual(results['prescriptions'][0]['common_gene_count'], 0)
+        self.assertTrue(_is_complete_analysis(results))
+
+    def test_missing_enrichment_is_incomplete(self):
+        results = {
+            'prescriptions': [{'unique_gene_count': 3}],
+            'enrichment_data': None,
+            'errors': []
+        }
+        self.assertFalse(_is_complete_analysis(results))
+
+
+if __name__ == '__main__':
+    unittest.main()